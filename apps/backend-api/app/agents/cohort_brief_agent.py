@@ -167,7 +167,8 @@ class CohortBriefAgent:
                     affected_vin_count=int(
                         anomaly.get("affected_vin_count", 1)
                     ),
-                    severity=str(anomaly.get("severity", "MEDIUM")),
+                    # Normalised once here so consumers compare with ==.
+                    severity=str(anomaly.get("severity", "MEDIUM")).upper(),
                     related_signals=anomaly.get("related_signals", []),
                 )
             )
@@ -182,11 +183,7 @@ class CohortBriefAgent:
         Deterministic executive summary (LLM-safe baseline).
         """
 
-        high_severity = [
-            a for a in anomalies if a.severity.upper() == "HIGH"
-        ]
-
-        if high_severity:
+        if self._high_severity_count(anomalies):
             return (
                 "Fleet health remains broadly stable, however multiple "
                 "high-severity anomalies require immediate attention."
@@ -200,6 +197,10 @@ class CohortBriefAgent:
 
         return "No significant fleet-level anomalies detected at this time."
 
+    @staticmethod
+    def _high_severity_count(anomalies: List[CohortAnomaly]) -> int:
+        return sum(1 for a in anomalies if a.severity == "HIGH")
+
     def _risk_distribution(
         self,
         metrics: List[Dict[str, Any]],
@@ -13,7 +13,7 @@ Used by:
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Mapping
 
 from app.models.vin import (
     EvidenceItem,
@@ -49,7 +49,7 @@ class VinExplainerAgent:
         mh_signals: List[Dict[str, Any]],
         mp_signals: List[Dict[str, Any]],
         fim_signals: List[Dict[str, Any]],
-        reference_map: Dict[str, Dict[str, Any]],
+        reference_map: Mapping[str, Mapping[str, Any]],
     ) -> VinInterpretation:
         """
         Produce a VIN-level interpretation from predictive signals.
@@ -149,7 +149,7 @@ class VinExplainerAgent:
         mh: List[Dict[str, Any]],
         mp: List[Dict[str, Any]],
         fim: List[Dict[str, Any]],
-        ref: Dict[str, Dict[str, Any]],
+        ref: Mapping[str, Mapping[str, Any]],
     ) -> List[EvidenceItem]:
         """
         Normalize raw mart rows into EvidenceItem objects.
@@ -206,6 +206,22 @@ class VinExplainerAgent:
 
         return evidence
 
+    def _compute_risk_level(
+        self,
+        evidence: List[EvidenceItem],
+    ) -> str:
+        """
+        Classify VIN risk from the count of high-confidence signals.
+        """
+
+        high_conf = sum(1 for e in evidence if e.confidence >= 0.8)
+
+        if high_conf >= 3:
+            return "HIGH"
+        if high_conf:
+            return "ELEVATED"
+        return "LOW"
+
     def _generate_summary(
         self,
         evidence: List[EvidenceItem],
@@ -215,22 +231,19 @@ class VinExplainerAgent:
         """
 
         # Deterministic fallback logic (LLM-safe baseline)
-        high_conf = [e for e in evidence if e.confidence >= 0.8]
+        risk = self._compute_risk_level(evidence)
 
-        if len(high_conf) >= 3:
-            risk = "HIGH"
+        if risk == "HIGH":
             summary = (
                 "Multiple high-confidence predictive signals indicate "
                 "a significant elevated risk for this vehicle."
             )
-        elif high_conf:
-            risk = "ELEVATED"
+        elif risk == "ELEVATED":
             summary = (
                 "One or more predictive signals suggest an elevated risk "
                 "that should be monitored."
             )
         else:
-            risk = "LOW"
             summary = (
                 "No high-confidence predictive anomalies detected at this time."
             )
@@ -19,6 +19,7 @@ from app.routers import (
     vin,
 )
 from app.utils.config import load_config
+from app.utils.databricks_conn import close_databricks_client
 from app.utils.logger import get_logger, log_event
 
 logger = get_logger(__name__)
@@ -83,6 +84,7 @@ def create_app() -> FastAPI:
 
     @app.on_event("shutdown")
     def on_shutdown() -> None:
+        close_databricks_client()
         log_event(
             logger,
             "Application shutdown",
@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 
 from app.models.action_pack import ActionPack
 from app.models.vin import Recommendation
-from app.services.genai_interpreter import GenAIInterpreter
+from app.services.genai_interpreter import GenAIInterpreter, get_interpreter_service
 from app.utils.logger import get_logger, log_event
 
 router = APIRouter(prefix="/action-pack", tags=["action-pack"])
@@ -40,7 +40,7 @@ class ActionPackRequest(BaseModel):
 # ---------------------------------------------------------------------
 
 def get_interpreter() -> GenAIInterpreter:
-    return GenAIInterpreter(model_version="v1.0.0")
+    return get_interpreter_service("v1.0.0")
 
 
 # ---------------------------------------------------------------------
@@ -3,23 +3,29 @@ Chat Router.
 
 Provides:
 - REST chat endpoint for explainability and interactive interpretation
+- Server-Sent Events endpoint streaming the reply as it is generated
 - WebSocket chat endpoint for low-latency fallback transport
 """
 
 from __future__ import annotations
 
+import json
+import logging
+from typing import Iterator
+
 from fastapi import APIRouter, Header, HTTPException
 from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
 from starlette.concurrency import run_in_threadpool
 
-from app.services.genai_interpreter import GenAIInterpreterService
+from app.services.genai_interpreter import get_interpreter_service
 from app.utils.logger import get_logger, log_event
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 logger = get_logger(__name__)
 
-genai_service = GenAIInterpreterService()
+genai_service = get_interpreter_service()
 
 # ------------------------------------------------------------
 # Request / Response models
@@ -98,6 +104,53 @@ def chat(
         ) from exc
 
 
+def _sse_event(payload: dict) -> str:
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+@router.post("/stream")
+def chat_stream(
+    request: ChatRequest,
+    x_request_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """
+    POST /chat/stream
+
+    Same scope as POST /chat, but the reply is sent as Server-Sent Events:
+    - {"type": "chat_chunk", "delta": "..."} per generated chunk
+    - {"type": "chat_done", "request_id": "..."} when complete
+    - {"type": "error", ...} if generation fails mid-stream
+    """
+
+    def _events() -> Iterator[str]:
+        try:
+            for chunk in genai_service.stream_chat_reply(
+                user_message=request.message,
+                context=request.context,
+                request_id=x_request_id,
+            ):
+                yield _sse_event({"type": "chat_chunk", "delta": chunk})
+        except Exception as exc:
+            log_event(
+                logger,
+                "Chat stream failed",
+                level=logging.ERROR,
+                extra={"request_id": x_request_id, "error_type": type(exc).__name__},
+            )
+            yield _sse_event(
+                {
+                    "type": "error",
+                    "request_id": x_request_id,
+                    "detail": "Failed to generate GenAI response.",
+                }
+            )
+            return
+
+        yield _sse_event({"type": "chat_done", "request_id": x_request_id})
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
+
+
 @router.websocket("/ws")
 async def chat_ws(websocket: WebSocket) -> None:
     """
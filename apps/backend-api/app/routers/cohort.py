@@ -10,7 +10,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 
 from app.models.cohort import CohortInterpretation, CohortListResponse
-from app.services.genai_interpreter import GenAIInterpreter
+from app.services.genai_interpreter import GenAIInterpreter, get_interpreter_service
 from app.utils.logger import get_logger, log_event
 
 router = APIRouter(prefix="/cohort", tags=["cohort"])
@@ -22,7 +22,7 @@ logger = get_logger(__name__)
 # ---------------------------------------------------------------------
 
 def get_interpreter() -> GenAIInterpreter:
-    return GenAIInterpreter(model_version="v1.0.0")
+    return get_interpreter_service("v1.0.0")
 
 
 # ---------------------------------------------------------------------
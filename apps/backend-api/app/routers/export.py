@@ -5,10 +5,14 @@ Provides endpoints for exporting interpretation results
 as deterministic PDF reports.
 """
 
-from fastapi import APIRouter, Header, HTTPException, Response
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
-from app.services.genai_interpreter import GenAIInterpreterService
+from app.services.genai_interpreter import get_interpreter_service
 from app.services.reference_loader import ReferenceLoader
 from app.utils.logger import get_logger
 
@@ -16,9 +20,13 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/export", tags=["export"])
 
-genai_service = GenAIInterpreterService()
+genai_service = get_interpreter_service()
 reference_loader = ReferenceLoader()
 
+# Rendered reports stay in memory up to this size, then spill to disk.
+_SPOOL_MAX_BYTES = 4 * 1024 * 1024
+_STREAM_CHUNK_BYTES = 64 * 1024
+
 
 def _get_pdf_exporter():
     try:
@@ -35,6 +43,17 @@ def _get_pdf_exporter():
     return PdfExporterService()
 
 
+def _iter_file(handle: BinaryIO) -> Iterator[bytes]:
+    try:
+        while True:
+            chunk = handle.read(_STREAM_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        handle.close()
+
+
 # ------------------------------------------------------------
 # Request model
 # ------------------------------------------------------------
@@ -61,7 +80,7 @@ class PdfExportRequest(BaseModel):
 def export_pdf(
     request: PdfExportRequest,
     x_request_id: str | None = Header(default=None),
-) -> Response:
+) -> StreamingResponse:
     """
     POST /export/pdf
 
@@ -79,7 +98,7 @@ def export_pdf(
                 request_id=x_request_id,
             )
             pdf_exporter = _get_pdf_exporter()
-            pdf_bytes = pdf_exporter.export_vin_report(interpretation)
+            write_report = pdf_exporter.write_vin_report
 
         elif subject_type == "cohort":
             interpretation = genai_service.interpret_cohort(
@@ -87,7 +106,7 @@ def export_pdf(
                 request_id=x_request_id,
             )
             pdf_exporter = _get_pdf_exporter()
-            pdf_bytes = pdf_exporter.export_cohort_report(interpretation)
+            write_report = pdf_exporter.write_cohort_report
 
         else:
             raise HTTPException(
@@ -95,14 +114,25 @@ def export_pdf(
                 detail="subject_type must be 'vin' or 'cohort'."
             )
 
-        return Response(
-            content=pdf_bytes,
+        # The report is rendered into a spooled file and streamed out in
+        # chunks, so large exports never sit in memory as one bytes object.
+        pdf_file = SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+        try:
+            size = write_report(interpretation, pdf_file)
+            pdf_file.seek(0)
+        except Exception:
+            pdf_file.close()
+            raise
+
+        return StreamingResponse(
+            _iter_file(pdf_file),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": (
                     f'attachment; filename="{subject_type}-'
                     f'{request.subject_id}.pdf"'
-                )
+                ),
+                "Content-Length": str(size),
             },
         )
 
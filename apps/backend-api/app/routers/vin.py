@@ -7,12 +7,12 @@ Thin HTTP layer over the GenAI interpreter.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Mapping
 
 from fastapi import APIRouter, Depends, Header, HTTPException, status
 
 from app.models.vin import VinInterpretation
-from app.services.genai_interpreter import GenAIInterpreter
+from app.services.genai_interpreter import GenAIInterpreter, get_interpreter_service
 from app.services.reference_loader import ReferenceLoader
 from app.utils.logger import get_logger, log_event
 
@@ -26,10 +26,10 @@ reference_loader = ReferenceLoader()
 # ---------------------------------------------------------------------
 
 def get_interpreter() -> GenAIInterpreter:
-    return GenAIInterpreter(model_version="v1.0.0")
+    return get_interpreter_service("v1.0.0")
 
 
-def load_reference_map() -> Dict[str, Dict[str, Any]]:
+def load_reference_map() -> Mapping[str, Mapping[str, Any]]:
     """
     Load merged semantic reference dictionary.
     """
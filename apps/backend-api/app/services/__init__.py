@@ -9,6 +9,7 @@ from app.services.mart_loader import MartLoader
 from app.services.genai_interpreter import (
     GenAIInterpreter,
     GenAIInterpreterService,
+    get_interpreter_service,
 )
 from app.services.reference_loader import ReferenceLoader
 
@@ -16,5 +17,6 @@ __all__ = [
     "MartLoader",
     "GenAIInterpreter",
     "GenAIInterpreterService",
+    "get_interpreter_service",
     "ReferenceLoader",
 ]
@@ -12,7 +12,10 @@ This service is the ONLY layer allowed to invoke GenAI agents.
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import logging
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
 
 from app.agents.cohort_brief_agent import CohortBriefAgent
 from app.agents.evidence_agent import EvidenceAgent
@@ -71,7 +74,7 @@ class GenAIInterpreterService:
         self,
         *,
         vin: str,
-        reference_map: Dict[str, Dict[str, Any]],
+        reference_map: Mapping[str, Mapping[str, Any]],
         request_id: str | None = None,
     ) -> VinInterpretation:
         """
@@ -102,27 +105,28 @@ class GenAIInterpreterService:
         interpretation = workflow_result.vin_interpretation
 
         consolidated_evidence = workflow_result.evidence_summary or self._evidence_agent.consolidate(
-            evidence=[
-                ev
-                for rec in interpretation.recommendations
-                for ev in rec.evidence
-            ]
+            evidence=list(
+                chain.from_iterable(
+                    rec.evidence for rec in interpretation.recommendations
+                )
+            )
         )
 
         interpretation = interpretation.copy(
             update={"evidence_summary": consolidated_evidence}
         )
 
-        log_event(
-            logger,
-            "VIN interpretation workflow completed",
-            extra={
-                "vin": vin,
-                "risk_level": interpretation.risk_level,
-                "evidence_sources": list(consolidated_evidence.keys()),
-                "langgraph_enabled": self._graph_runner.langgraph_enabled,
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "VIN interpretation workflow completed",
+                extra={
+                    "vin": vin,
+                    "risk_level": interpretation.risk_level,
+                    "evidence_sources": list(consolidated_evidence.keys()),
+                    "langgraph_enabled": self._graph_runner.langgraph_enabled,
+                },
+            )
 
         return interpretation
 
@@ -244,15 +248,93 @@ class GenAIInterpreterService:
 
         set_request_id(request_id)
 
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "Generating GenAI chat reply",
+                extra={
+                    "message_length": len(user_message),
+                    "context_keys": list(context.keys()) if context else [],
+                },
+            )
+
+        context, deterministic_reply = self._prepare_chat(
+            user_message=user_message,
+            context=context,
+            request_id=request_id,
+        )
+        reply = self._graph_runner.compose_chat_reply(
+            user_message=user_message,
+            context=context,
+            deterministic_reply=deterministic_reply,
+        )
+
         log_event(
             logger,
-            "Generating GenAI chat reply",
-            extra={
-                "message_length": len(user_message),
-                "context_keys": list(context.keys()) if context else [],
-            },
+            "GenAI chat reply generated",
+            extra={"reply_length": len(reply)},
+        )
+
+        return reply
+
+    def stream_chat_reply(
+        self,
+        *,
+        user_message: str,
+        context: Dict[str, Any] | None = None,
+        request_id: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Streaming counterpart of generate_chat_reply.
+
+        Context enrichment is identical; the reply is yielded in chunks and
+        is not run through hybrid scoring (see NarrativeComposer).
+        """
+
+        set_request_id(request_id)
+
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "Streaming GenAI chat reply",
+                extra={
+                    "message_length": len(user_message),
+                    "context_keys": list(context.keys()) if context else [],
+                },
+            )
+
+        context, deterministic_reply = self._prepare_chat(
+            user_message=user_message,
+            context=context,
+            request_id=request_id,
+        )
+        reply_length = 0
+        for chunk in self._graph_runner.stream_chat_reply(
+            user_message=user_message,
+            context=context,
+            deterministic_reply=deterministic_reply or "",
+        ):
+            reply_length += len(chunk)
+            yield chunk
+
+        log_event(
+            logger,
+            "GenAI chat reply streamed",
+            extra={"reply_length": reply_length},
         )
 
+    def _prepare_chat(
+        self,
+        *,
+        user_message: str,
+        context: Dict[str, Any] | None,
+        request_id: str | None,
+    ) -> Tuple[Dict[str, Any] | None, Optional[str]]:
+        """
+        Enrich the chat context for its VIN or cohort and build the
+        deterministic agent reply, if the context names one.
+        """
+
         # Simple routing heuristic (expand later if needed)
         if context and "vin" in context:
             if "risk_level" not in context:
@@ -273,16 +355,12 @@ class GenAIInterpreterService:
                 except Exception:
                     # Keep chat resilient even if interpretation lookup fails.
                     pass
-            deterministic_reply = self._vin_agent.answer_question(
+            return context, self._vin_agent.answer_question(
                 question=user_message,
                 context=context,
             )
-            reply = self._graph_runner.compose_chat_reply(
-                user_message=user_message,
-                context=context,
-                deterministic_reply=deterministic_reply,
-            )
-        elif context and "cohort_id" in context:
+
+        if context and "cohort_id" in context:
             if "anomaly_count" not in context:
                 try:
                     cohort_data = self.interpret_cohort(
@@ -296,29 +374,23 @@ class GenAIInterpreterService:
                     }
                 except Exception:
                     pass
-            deterministic_reply = self._cohort_agent.answer_question(
+            return context, self._cohort_agent.answer_question(
                 question=user_message,
                 context=context,
             )
-            reply = self._graph_runner.compose_chat_reply(
-                user_message=user_message,
-                context=context,
-                deterministic_reply=deterministic_reply,
-            )
-        else:
-            reply = self._graph_runner.compose_chat_reply(
-                user_message=user_message,
-                context=context,
-            )
-
-        log_event(
-            logger,
-            "GenAI chat reply generated",
-            extra={"reply_length": len(reply)},
-        )
-
-        return reply
 
+        return context, None
 
 # Backward-compatible alias used by legacy routers/tests.
 GenAIInterpreter = GenAIInterpreterService
+
+
+@lru_cache(maxsize=4)
+def get_interpreter_service(model_version: str = "v1") -> GenAIInterpreterService:
+    """
+    Return a process-wide interpreter for the given model version.
+
+    Agents, loaders, and compiled graphs are stateless across requests,
+    so routers share one instance instead of rebuilding it per call.
+    """
+    return GenAIInterpreterService(model_version=model_version)
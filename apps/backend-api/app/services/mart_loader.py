@@ -8,54 +8,158 @@ Reads predictive telemetry from:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import mmap
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
 
-from pydantic import BaseModel, Field, ValidationError, root_validator
+from pydantic import BaseModel, Field, root_validator, validate_model
 
-from app.utils.config import load_config
-from app.utils.databricks_conn import DatabricksClient
+from app.utils.config import AppConfig, load_config, register_reload_hook
+from app.utils.databricks_conn import get_databricks_client
 from app.utils.logger import get_logger, log_event
 
 logger = get_logger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+
+    _ARROW_AVAILABLE = True
+except Exception:  # pragma: no cover - depends on optional runtime packages
+    _ARROW_AVAILABLE = False
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _ORJSON_AVAILABLE = True
+except Exception:  # pragma: no cover - depends on optional runtime packages
+    _json_loads = json.loads
+    _ORJSON_AVAILABLE = False
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _load_json_file(path: Path) -> Any:
+    """
+    Parse a UTF-8 JSON file, tolerating a leading BOM.
+
+    With orjson the parser reads straight from a memory-mapped view of the
+    file, so the payload is never copied into a Python bytes object.
+    """
+    if not _ORJSON_AVAILABLE or path.stat().st_size == 0:
+        raw = path.read_bytes()
+        if raw.startswith(_UTF8_BOM):
+            raw = raw[len(_UTF8_BOM):]
+        return _json_loads(raw)
+
+    with path.open("rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mapped:
+        offset = len(_UTF8_BOM) if mapped[: len(_UTF8_BOM)] == _UTF8_BOM else 0
+        with memoryview(mapped) as view:
+            return _json_loads(view[offset:])
+
 
 class MartLoaderError(RuntimeError):
     pass
 
 
-VIN_PATTERN = re.compile(r"^[A-HJ-NPR-Z0-9]{5,32}$")
-COHORT_PATTERN = re.compile(r"^[A-Za-z0-9_.:-]{2,128}$")
+class ArrowRecords:
+    """
+    Lazy row view over a pyarrow Table returned by the SQL warehouse.
 
+    Iterating yields one dict per row, materialized a record batch at a time.
+    `column(name)` exposes the underlying Arrow array for columnar consumers.
+    """
 
-class _SampleVINEntrySchema(BaseModel):
-    vin: str = Field(..., min_length=5, max_length=32)
-    mh: List[Dict[str, Any]] = Field(default_factory=list)
-    mp: List[Dict[str, Any]] = Field(default_factory=list)
-    fim: List[Dict[str, Any]] = Field(default_factory=list)
+    __slots__ = ("_table",)
 
-    class Config:
-        extra = "ignore"
+    def __init__(self, table: Any) -> None:
+        self._table = table
 
+    def __len__(self) -> int:
+        return self._table.num_rows
 
-class _SampleCohortEntrySchema(BaseModel):
-    cohort_id: str = Field(..., min_length=2, max_length=128)
-    metrics: List[Dict[str, Any]] = Field(default_factory=list)
-    anomalies: List[Dict[str, Any]] = Field(default_factory=list)
-    description: Optional[str] = None
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for batch in self._table.to_batches():
+            yield from batch.to_pylist()
 
-    class Config:
-        extra = "ignore"
+    @property
+    def columns(self) -> List[str]:
+        return list(self._table.column_names)
 
+    def column(self, name: str) -> Any:
+        return self._table.column(name)
 
-class _SamplePayloadSchema(BaseModel):
-    vins: List[_SampleVINEntrySchema] = Field(default_factory=list)
-    cohorts: List[_SampleCohortEntrySchema] = Field(default_factory=list)
 
-    class Config:
-        extra = "ignore"
+def _lowercase_columns(table: Any) -> Any:
+    names = table.column_names
+    lowered = [name.lower() for name in names]
+    if lowered == names:
+        return table
+    return table.rename_columns(lowered)
+
+
+class _TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire `ttl` seconds after insertion.
+
+    A non-positive TTL disables caching entirely.
+    """
+
+    __slots__ = ("_maxsize", "_ttl", "_entries", "_lock")
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+VIN_PATTERN = re.compile(r"^[A-HJ-NPR-Z0-9]{5,32}$")
+COHORT_PATTERN = re.compile(r"^[A-Za-z0-9_.:-]{2,128}$")
+_VIN_MATCH = VIN_PATTERN.match
+_COHORT_MATCH = COHORT_PATTERN.match
+
+
+# Entry-level layout of the sample payload: (section, id key, id length
+# bounds, row-list keys). Rows themselves are validated when served.
+_SAMPLE_SECTIONS: Tuple[Tuple[str, str, int, int, Tuple[str, ...]], ...] = (
+    ("vins", "vin", 5, 32, ("mh", "mp", "fim")),
+    ("cohorts", "cohort_id", 2, 128, ("metrics", "anomalies")),
+)
 
 
 class _MHRowSchema(BaseModel):
@@ -144,6 +248,70 @@ class _FIMRowSchema(BaseModel):
         return values
 
 
+class _FastRowSpec(NamedTuple):
+    identifier_fields: Tuple[str, ...]
+    probability_fields: Tuple[str, ...]
+    timestamp_fields: Tuple[str, ...]
+
+
+# Plain-dict prechecks mirroring the telemetry row schemas. A row that
+# passes is returned as-is (minus nulls); anything else, including values
+# that pydantic would coerce, goes through full schema validation.
+_FAST_ROW_SPECS: Dict[Type[BaseModel], _FastRowSpec] = {
+    _MHRowSchema: _FastRowSpec(
+        identifier_fields=("hi_code", "signal_code"),
+        probability_fields=("confidence", "trigger_probability", "rootcause_probability"),
+        timestamp_fields=("observed_at", "trigger_time", "event_time"),
+    ),
+    _MPRowSchema: _FastRowSpec(
+        identifier_fields=("signal_code", "trigger_code"),
+        probability_fields=("confidence", "trigger_probability"),
+        timestamp_fields=("observed_at", "trigger_time", "event_time"),
+    ),
+    _FIMRowSchema: _FastRowSpec(
+        identifier_fields=("signal_code", "rootcause_code"),
+        probability_fields=("confidence", "rootcause_probability"),
+        timestamp_fields=("observed_at", "trigger_time", "event_time"),
+    ),
+}
+
+
+def _passes_fast_row_check(row: Dict[str, Any], spec: _FastRowSpec) -> bool:
+    has_identifier = False
+    for key in spec.identifier_fields:
+        value = row.get(key)
+        if value is None:
+            continue
+        if type(value) is not str:
+            return False
+        if value:
+            has_identifier = True
+    if not has_identifier:
+        return False
+
+    has_probability = False
+    for key in spec.probability_fields:
+        value = row.get(key)
+        if value is None:
+            continue
+        if type(value) is not float or not 0.0 <= value <= 1.0:
+            return False
+        has_probability = True
+    if not has_probability:
+        return False
+
+    return any(row.get(key) is not None for key in spec.timestamp_fields)
+
+
+# Explicit projections keep unused mart columns out of the warehouse scan and
+# the wire transfer. VIN marts follow data/marts/*.sql; `vin` is required
+# to group batched results. Cohort marts have no committed DDL and their
+# row schemas accept column aliases, so cohort queries keep SELECT *.
+_MH_COLUMNS = ("vin", "hi_code", "confidence", "observed_at")
+_MP_COLUMNS = ("vin", "signal_code", "confidence", "trigger_time")
+_FIM_COLUMNS = ("vin", "signal_code", "confidence", "observed_at")
+
+
 class _CohortMetricRowSchema(BaseModel):
     metric_name: Optional[str] = None
     name: Optional[str] = None
@@ -175,6 +343,19 @@ class _CohortAnomalyRowSchema(BaseModel):
         extra = "allow"
 
 
+# Loaders are held weakly so registering for config reloads does not keep a
+# discarded loader (and its cache) alive.
+_live_loaders: "weakref.WeakSet[MartLoader]" = weakref.WeakSet()
+
+
+def _reload_live_loaders(config: AppConfig) -> None:
+    for loader in list(_live_loaders):
+        loader._apply_config(config)
+
+
+register_reload_hook(_reload_live_loaders)
+
+
 class MartLoader:
     """
     Read-only access layer for predictive marts.
@@ -182,83 +363,114 @@ class MartLoader:
 
     def __init__(self) -> None:
         self._config = load_config()
-        self._client = DatabricksClient()
+        self._client = get_databricks_client()
         self._sample_cache: Dict[str, Any] | None = None
+        self._sample_vin_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._sample_cohort_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._sample_cohort_registry: Optional[List[Any]] = None
+        self._mart_cache = self._new_mart_cache()
+        _live_loaders.add(self)
 
     # -----------------------------------------------------------------
     # VIN-level marts
     # -----------------------------------------------------------------
 
-    def load_mh_snapshot(self, vin: str) -> List[Dict[str, Any]]:
+    def load_mh_snapshot(
+        self,
+        vin: str,
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         vin = self._normalize_vin(vin)
-        if self._config.data.source == "sample":
-            rows = self._sample_vin_rows(vin).get("mh", [])
-            return self._validate_rows(
-                rows,
-                schema=_MHRowSchema,
-                dataset_name="mh_snapshot",
-            )
+        return self.load_mh_snapshots([vin], limit=limit)[vin]
 
-        table = self._qualified_table(self._config.data.mart_mh_table)
-        query = (
-            "SELECT * "
-            f"FROM {table} "
-            f"WHERE vin = '{self._escape_literal(vin)}' "
-            "ORDER BY observed_at DESC"
+    def load_mp_triggers(
+        self,
+        vin: str,
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        vin = self._normalize_vin(vin)
+        return self.load_mp_triggers_for_vins([vin], limit=limit)[vin]
+
+    def load_fim_root_causes(
+        self,
+        vin: str,
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        vin = self._normalize_vin(vin)
+        return self.load_fim_root_causes_for_vins([vin], limit=limit)[vin]
+
+    async def load_vin_bundle(
+        self,
+        vin: str,
+        *,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Load the MH, MP and FIM marts for one VIN concurrently.
+
+        The loaders are blocking warehouse calls, so each runs in a worker
+        thread and the bundle takes as long as the slowest of the three.
+        """
+        vin = self._normalize_vin(vin)
+        mh, mp, fim = await asyncio.gather(
+            asyncio.to_thread(self.load_mh_snapshot, vin, limit=limit),
+            asyncio.to_thread(self.load_mp_triggers, vin, limit=limit),
+            asyncio.to_thread(self.load_fim_root_causes, vin, limit=limit),
         )
-        rows = self._execute(query, query_tag="mh_snapshot")
-        return self._validate_rows(
-            rows,
+        return {"mh": mh, "mp": mp, "fim": fim}
+
+    def load_mh_snapshots(
+        self,
+        vins: Iterable[str],
+        *,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        return self._load_vin_mart(
+            vins,
+            table_name=self._config.data.mart_mh_table,
+            columns=_MH_COLUMNS,
+            order_column="observed_at",
+            sample_key="mh",
             schema=_MHRowSchema,
             dataset_name="mh_snapshot",
+            limit=limit,
         )
 
-    def load_mp_triggers(self, vin: str) -> List[Dict[str, Any]]:
-        vin = self._normalize_vin(vin)
-        if self._config.data.source == "sample":
-            rows = self._sample_vin_rows(vin).get("mp", [])
-            return self._validate_rows(
-                rows,
-                schema=_MPRowSchema,
-                dataset_name="mp_triggers",
-            )
-
-        table = self._qualified_table(self._config.data.mart_mp_table)
-        query = (
-            "SELECT * "
-            f"FROM {table} "
-            f"WHERE vin = '{self._escape_literal(vin)}' "
-            "ORDER BY trigger_time DESC"
-        )
-        rows = self._execute(query, query_tag="mp_triggers")
-        return self._validate_rows(
-            rows,
+    def load_mp_triggers_for_vins(
+        self,
+        vins: Iterable[str],
+        *,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        return self._load_vin_mart(
+            vins,
+            table_name=self._config.data.mart_mp_table,
+            columns=_MP_COLUMNS,
+            order_column="trigger_time",
+            sample_key="mp",
             schema=_MPRowSchema,
             dataset_name="mp_triggers",
+            limit=limit,
         )
 
-    def load_fim_root_causes(self, vin: str) -> List[Dict[str, Any]]:
-        vin = self._normalize_vin(vin)
-        if self._config.data.source == "sample":
-            rows = self._sample_vin_rows(vin).get("fim", [])
-            return self._validate_rows(
-                rows,
-                schema=_FIMRowSchema,
-                dataset_name="fim_rootcause",
-            )
-
-        table = self._qualified_table(self._config.data.mart_fim_table)
-        query = (
-            "SELECT * "
-            f"FROM {table} "
-            f"WHERE vin = '{self._escape_literal(vin)}' "
-            "ORDER BY observed_at DESC"
-        )
-        rows = self._execute(query, query_tag="fim_rootcause")
-        return self._validate_rows(
-            rows,
+    def load_fim_root_causes_for_vins(
+        self,
+        vins: Iterable[str],
+        *,
+        limit: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        return self._load_vin_mart(
+            vins,
+            table_name=self._config.data.mart_fim_table,
+            columns=_FIM_COLUMNS,
+            order_column="observed_at",
+            sample_key="fim",
             schema=_FIMRowSchema,
             dataset_name="fim_rootcause",
+            limit=limit,
         )
 
     # -----------------------------------------------------------------
@@ -276,19 +488,30 @@ class MartLoader:
             )
 
         table = self._qualified_table(self._config.data.mart_cohort_metrics_table)
+        # Not limited: a cohort has a handful of metric rows and the mart has
+        # no ranking column, so a LIMIT would drop arbitrary metrics.
         query = (
             "SELECT * "
             f"FROM {table} "
-            f"WHERE cohort_id = '{self._escape_literal(cohort_id)}'"
+            "WHERE cohort_id = ?"
+        )
+        rows = self._execute(
+            query,
+            query_tag="cohort_metrics",
+            query_params=[cohort_id],
         )
-        rows = self._execute(query, query_tag="cohort_metrics")
         return self._validate_rows(
             rows,
             schema=_CohortMetricRowSchema,
             dataset_name="cohort_metrics",
         )
 
-    def load_cohort_anomalies(self, cohort_id: str) -> List[Dict[str, Any]]:
+    def load_cohort_anomalies(
+        self,
+        cohort_id: str,
+        *,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         cohort_id = self._normalize_cohort(cohort_id)
         if self._config.data.source == "sample":
             rows = self._sample_cohort_rows(cohort_id).get("anomalies", [])
@@ -302,10 +525,19 @@ class MartLoader:
         query = (
             "SELECT * "
             f"FROM {table} "
-            f"WHERE cohort_id = '{self._escape_literal(cohort_id)}' "
-            "ORDER BY severity DESC"
+            "WHERE cohort_id = ? "
+            # Ranked explicitly so the LIMIT cuts the least severe rows first;
+            # ordering the severity text would sort HIGH after MEDIUM and LOW.
+            "ORDER BY CASE upper(severity) "
+            "WHEN 'HIGH' THEN 0 WHEN 'MEDIUM' THEN 1 ELSE 2 END, "
+            "affected_vin_count DESC"
+            f"{self._limit_clause(limit)}"
+        )
+        rows = self._execute(
+            query,
+            query_tag="cohort_anomalies",
+            query_params=[cohort_id],
         )
-        rows = self._execute(query, query_tag="cohort_anomalies")
         return self._validate_rows(
             rows,
             schema=_CohortAnomalyRowSchema,
@@ -314,10 +546,7 @@ class MartLoader:
 
     def list_cohorts(self) -> List[Dict[str, str | None]]:
         if self._config.data.source == "sample":
-            cohorts = self._sample_data().get("cohorts", [])
-            if not isinstance(cohorts, list):
-                raise MartLoaderError("Sample data 'cohorts' must be a list")
-            return self._normalize_cohort_items(cohorts)
+            return self._normalize_cohort_items(self._sample_cohort_items())
 
         metrics_table = self._qualified_table(self._config.data.mart_cohort_metrics_table)
         anomalies_table = self._qualified_table(self._config.data.mart_cohort_anomalies_table)
@@ -334,17 +563,146 @@ class MartLoader:
         rows = self._execute(query, query_tag="cohort_list")
         return self._normalize_cohort_items(rows)
 
+    def clear_cache(self) -> None:
+        """Drop cached VIN mart results, e.g. after a mart refresh."""
+        self._mart_cache.clear()
+
+    def _apply_config(self, config: AppConfig) -> None:
+        # Rows cached under the old tables, source or TTL must not outlive it,
+        # so the cache is rebuilt with the new size and TTL.
+        self._config = config
+        self._mart_cache = self._new_mart_cache()
+
+    def _new_mart_cache(self) -> _TTLCache:
+        return _TTLCache(
+            maxsize=self._config.data.mart_cache_size,
+            ttl=self._config.data.mart_cache_ttl_seconds,
+        )
+
     # -----------------------------------------------------------------
     # Internal helpers
     # -----------------------------------------------------------------
 
-    def _execute(self, query: str, *, query_tag: str) -> List[Dict[str, Any]]:
-        try:
-            columns, rows = self._client.execute_query(
+    def _load_vin_mart(
+        self,
+        vins: Iterable[str],
+        *,
+        table_name: str,
+        columns: Tuple[str, ...],
+        order_column: str,
+        sample_key: str,
+        schema: Type[BaseModel],
+        dataset_name: str,
+        limit: Optional[int],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        # dict.fromkeys dedupes while keeping request order for the result keys.
+        normalized = list(dict.fromkeys(self._normalize_vin(vin) for vin in vins))
+        if not normalized:
+            return {}
+
+        row_limit = self._row_limit(limit)
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        missing: List[str] = []
+        for vin in normalized:
+            cached = self._mart_cache.get((dataset_name, vin, row_limit))
+            if cached is None:
+                missing.append(vin)
+            else:
+                results[vin] = [dict(row) for row in cached]
+
+        if missing:
+            fetched = self._query_vin_mart(
+                missing,
+                table_name=table_name,
+                columns=columns,
+                order_column=order_column,
+                sample_key=sample_key,
+                schema=schema,
+                dataset_name=dataset_name,
+                row_limit=row_limit,
+            )
+            # Cached rows never leave the cache: callers get their own dicts
+            # on both paths, so mutating a result cannot alter later hits.
+            # VIN mart values are scalars, so a shallow copy is enough.
+            for vin, rows in fetched.items():
+                self._mart_cache.set((dataset_name, vin, row_limit), tuple(rows))
+                results[vin] = [dict(row) for row in rows]
+
+        return {vin: results[vin] for vin in normalized}
+
+    def _query_vin_mart(
+        self,
+        vins: List[str],
+        *,
+        table_name: str,
+        columns: Tuple[str, ...],
+        order_column: str,
+        sample_key: str,
+        schema: Type[BaseModel],
+        dataset_name: str,
+        row_limit: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        if self._config.data.source == "sample":
+            return {
+                vin: self._validate_rows(
+                    self._sample_vin_rows(vin).get(sample_key, []),
+                    schema=schema,
+                    dataset_name=dataset_name,
+                )
+                for vin in vins
+            }
+
+        # One round trip per mart; the row limit applies per VIN rather than
+        # across the whole IN (...) set.
+        table = self._qualified_table(table_name)
+        placeholders = ", ".join(["?"] * len(vins))
+        query = (
+            f"SELECT {', '.join(columns)} "
+            f"FROM {table} "
+            f"WHERE vin IN ({placeholders}) "
+            "QUALIFY ROW_NUMBER() OVER "
+            f"(PARTITION BY vin ORDER BY {order_column} DESC) <= {row_limit} "
+            f"ORDER BY vin, {order_column} DESC"
+        )
+        rows = self._execute(
+            query,
+            query_tag=dataset_name,
+            query_params=vins,
+        )
+
+        grouped: Dict[str, List[Dict[str, Any]]] = {vin: [] for vin in vins}
+        for row in self._validate_rows(rows, schema=schema, dataset_name=dataset_name):
+            bucket = grouped.get(str(row.get("vin", "")).upper())
+            if bucket is not None:
+                bucket.append(row)
+        return grouped
+
+    def _execute(
+        self,
+        query: str,
+        *,
+        query_tag: str,
+        query_params: Optional[List[Any]] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        if not _ARROW_AVAILABLE:
+            return self._stream_records(
                 query,
                 query_tag=query_tag,
+                query_params=query_params,
+            )
+
+        try:
+            # Column names are lowercased once per result so row lookups can
+            # use plain dict access instead of case-insensitive scans.
+            records = ArrowRecords(
+                _lowercase_columns(
+                    self._client.execute_query_arrow(
+                        query,
+                        query_tag=query_tag,
+                        query_params=query_params,
+                    )
+                )
             )
-            records = [dict(zip(columns, row)) for row in rows]
 
             log_event(
                 logger,
@@ -358,27 +716,62 @@ class MartLoader:
                 f"Failed to load mart data ({query_tag})"
             ) from exc
 
+    def _stream_records(
+        self,
+        query: str,
+        *,
+        query_tag: str,
+        query_params: Optional[List[Any]],
+    ) -> Iterator[Dict[str, Any]]:
+        # Without pyarrow, rows are pulled in fetchmany batches and validated
+        # as they arrive instead of being materialized up front.
+        row_count = 0
+        try:
+            for record in self._client.stream_query(
+                query,
+                query_tag=query_tag,
+                query_params=query_params,
+                lowercase_columns=True,
+            ):
+                row_count += 1
+                yield record
+        except Exception as exc:
+            raise MartLoaderError(
+                f"Failed to load mart data ({query_tag})"
+            ) from exc
+
+        log_event(
+            logger,
+            "Mart query loaded",
+            extra={"query_tag": query_tag, "row_count": row_count},
+        )
+
     def _qualified_table(self, table_name: str) -> str:
         dbx = self._config.databricks
         if dbx is None:
             return table_name
         return f"{dbx.catalog}.{dbx.schema_name}.{table_name}"
 
-    @staticmethod
-    def _escape_literal(value: str) -> str:
-        return value.replace("'", "''")
+    def _limit_clause(self, limit: Optional[int]) -> str:
+        return f" LIMIT {self._row_limit(limit)}"
+
+    def _row_limit(self, limit: Optional[int]) -> int:
+        row_limit = int(self._config.data.mart_query_limit if limit is None else limit)
+        if row_limit <= 0:
+            raise MartLoaderError("Mart query limit must be a positive integer")
+        return row_limit
 
     @staticmethod
     def _normalize_vin(vin: str) -> str:
         normalized = vin.strip().upper()
-        if not VIN_PATTERN.match(normalized):
+        if not _VIN_MATCH(normalized):
             raise MartLoaderError("Invalid VIN format")
         return normalized
 
     @staticmethod
     def _normalize_cohort(cohort_id: str) -> str:
         normalized = cohort_id.strip()
-        if not COHORT_PATTERN.match(normalized):
+        if not _COHORT_MATCH(normalized):
             raise MartLoaderError("Invalid cohort_id format")
         return normalized
 
@@ -392,50 +785,88 @@ class MartLoader:
                 f"Sample data file not found: {sample_path}"
             )
 
-        with sample_path.open("r", encoding="utf-8-sig") as handle:
-            data = json.load(handle)
+        data = _load_json_file(sample_path)
 
         if not isinstance(data, dict):
             raise MartLoaderError("Sample data must be a JSON object")
 
-        try:
-            _SamplePayloadSchema.parse_obj(data)
-        except ValidationError as exc:
-            raise MartLoaderError(
-                "Sample data does not match expected ingestion schema"
-            ) from exc
-
+        self._check_sample_sections(data)
         self._sample_cache = data
         return data
 
-    def _sample_vin_rows(self, vin: str) -> Dict[str, Any]:
-        vins = self._sample_data().get("vins", [])
-        if not isinstance(vins, list):
-            raise MartLoaderError("Sample data 'vins' must be a list")
-
-        for item in vins:
-            if str(item.get("vin", "")).upper() == vin:
-                return item
+    @staticmethod
+    def _check_sample_sections(data: Dict[str, Any]) -> None:
+        # Cheap structural pass over VIN/cohort entries only; the nested mart
+        # rows are left to _validate_rows, which checks every row it serves.
+        for section, id_key, min_length, max_length, row_keys in _SAMPLE_SECTIONS:
+            entries = data.get(section, [])
+            if not isinstance(entries, list):
+                raise MartLoaderError(f"Sample data '{section}' must be a list")
+
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    raise MartLoaderError(
+                        "Sample data does not match expected ingestion schema"
+                    )
+                entry_id = entry.get(id_key)
+                if (
+                    isinstance(entry_id, bool)
+                    or not isinstance(entry_id, (str, int))
+                    or not min_length <= len(str(entry_id)) <= max_length
+                    or any(not isinstance(entry.get(key, []), list) for key in row_keys)
+                ):
+                    raise MartLoaderError(
+                        "Sample data does not match expected ingestion schema"
+                    )
+
+    # Sample indices are built per section on first use, so a cohort-only
+    # caller never walks the VIN list and vice versa.
 
-        return {"mh": [], "mp": [], "fim": []}
+    def _sample_vin_rows(self, vin: str) -> Dict[str, Any]:
+        if self._sample_vin_index is None:
+            # setdefault keeps the first occurrence, matching the former linear scan.
+            vin_index: Dict[str, Dict[str, Any]] = {}
+            for item in self._sample_data().get("vins", []):
+                vin_index.setdefault(str(item.get("vin", "")).upper(), item)
+            self._sample_vin_index = vin_index
+
+        item = self._sample_vin_index.get(vin)
+        if item is None:
+            return {"mh": [], "mp": [], "fim": []}
+        return item
 
     def _sample_cohort_rows(self, cohort_id: str) -> Dict[str, Any]:
-        cohorts = self._sample_data().get("cohorts", [])
-        if not isinstance(cohorts, list):
-            raise MartLoaderError("Sample data 'cohorts' must be a list")
-
-        for item in cohorts:
-            if str(item.get("cohort_id", "")) == cohort_id:
-                return item
-
-        return {"metrics": [], "anomalies": []}
+        if self._sample_cohort_index is None:
+            cohort_index: Dict[str, Dict[str, Any]] = {}
+            for item in self._sample_data().get("cohorts", []):
+                cohort_index.setdefault(str(item.get("cohort_id", "")), item)
+            self._sample_cohort_index = cohort_index
+
+        item = self._sample_cohort_index.get(cohort_id)
+        if item is None:
+            return {"metrics": [], "anomalies": []}
+        return item
+
+    def _sample_cohort_items(self) -> List[Any]:
+        if self._sample_cohort_registry is None:
+            # Registry rows get lowercase keys once, matching warehouse results.
+            self._sample_cohort_registry = [
+                {str(key).lower(): value for key, value in item.items()}
+                if isinstance(item, dict)
+                else item
+                for item in self._sample_data().get("cohorts", [])
+            ]
+        return self._sample_cohort_registry
 
     def _normalize_cohort_items(
         self,
-        rows: List[Dict[str, Any]],
+        rows: Iterable[Dict[str, Any]],
     ) -> List[Dict[str, str | None]]:
-        unique: List[Dict[str, str | None]] = []
-        seen_ids = set()
+        # Pass 1 extracts parallel id/description columns; pass 2 dedupes on
+        # the id column alone, keeping the first description seen per cohort.
+        strict = bool(self._config.features.strict_validation)
+        cohort_ids: List[str] = []
+        descriptions: List[Any] = []
 
         for idx, row in enumerate(rows):
             if not isinstance(row, dict):
@@ -443,75 +874,93 @@ class MartLoader:
                     dataset_name="cohort_list",
                     row_index=idx,
                     reason="Row must be an object",
+                    strict=strict,
                 )
                 continue
 
-            raw_cohort_id = self._get_case_insensitive(row, "cohort_id")
+            raw_cohort_id = row.get("cohort_id")
             if raw_cohort_id is None:
                 self._handle_invalid_row(
                     dataset_name="cohort_list",
                     row_index=idx,
                     reason="Missing cohort_id",
+                    strict=strict,
                 )
                 continue
 
             try:
-                cohort_id = self._normalize_cohort(str(raw_cohort_id))
+                cohort_ids.append(self._normalize_cohort(str(raw_cohort_id)))
             except MartLoaderError as exc:
                 self._handle_invalid_row(
                     dataset_name="cohort_list",
                     row_index=idx,
                     reason=str(exc),
+                    strict=strict,
                 )
                 continue
 
-            if cohort_id in seen_ids:
-                continue
-            seen_ids.add(cohort_id)
-
-            description_raw = self._get_case_insensitive(row, "description")
+            description_raw = row.get("description")
             if description_raw is None:
-                description_raw = self._get_case_insensitive(row, "cohort_description")
-
-            unique.append(
-                {
-                    "cohort_id": cohort_id,
-                    "cohort_description": (
-                        str(description_raw).strip()
-                        if isinstance(description_raw, str) and description_raw.strip()
-                        else None
-                    ),
-                }
-            )
-
-        return unique
+                description_raw = row.get("cohort_description")
+            descriptions.append(description_raw)
+
+        first_seen: Dict[str, Any] = {}
+        for cohort_id, description_raw in zip(cohort_ids, descriptions):
+            if cohort_id not in first_seen:
+                first_seen[cohort_id] = description_raw
+
+        return [
+            {
+                "cohort_id": cohort_id,
+                "cohort_description": (
+                    description_raw.strip()
+                    if isinstance(description_raw, str) and description_raw.strip()
+                    else None
+                ),
+            }
+            for cohort_id, description_raw in first_seen.items()
+        ]
 
     def _validate_rows(
         self,
-        rows: List[Dict[str, Any]],
+        rows: Iterable[Dict[str, Any]],
         *,
         schema: Type[BaseModel],
         dataset_name: str,
     ) -> List[Dict[str, Any]]:
         valid_rows: List[Dict[str, Any]] = []
+        fast_spec = _FAST_ROW_SPECS.get(schema)
+        # Resolved once per batch rather than per invalid row.
+        strict = bool(self._config.features.strict_validation)
         for idx, row in enumerate(rows):
             if not isinstance(row, dict):
                 self._handle_invalid_row(
                     dataset_name=dataset_name,
                     row_index=idx,
                     reason="Row must be an object",
+                    strict=strict,
                 )
                 continue
-            try:
-                normalized = schema.parse_obj(row).dict(exclude_none=True)
-                valid_rows.append(normalized)
-            except ValidationError as exc:
-                reason = exc.errors()[0].get("msg", "Schema validation failed")
+            if fast_spec is not None and _passes_fast_row_check(row, fast_spec):
+                valid_rows.append(
+                    {key: value for key, value in row.items() if value is not None}
+                )
+                continue
+            # validate_model runs field and root validators without building a
+            # model instance (or raising) only to dump it straight back to a dict.
+            values, _, error = validate_model(schema, row)
+            if error is not None:
+                reason = error.errors()[0].get("msg", "Schema validation failed")
                 self._handle_invalid_row(
                     dataset_name=dataset_name,
                     row_index=idx,
                     reason=reason,
+                    strict=strict,
                 )
+                continue
+            valid_rows.append(
+                {key: value for key, value in values.items() if value is not None}
+            )
 
         return valid_rows
 
@@ -521,9 +970,9 @@ class MartLoader:
         dataset_name: str,
         row_index: int,
         reason: str,
+        strict: bool,
     ) -> None:
-        strict_validation = self._config.features.strict_validation
-        if strict_validation:
+        if strict:
             raise MartLoaderError(
                 f"Invalid mart data for {dataset_name} at row {row_index}: {reason}"
             )
@@ -538,17 +987,6 @@ class MartLoader:
             },
         )
 
-    @staticmethod
-    def _get_case_insensitive(row: Dict[str, Any], key: str) -> Any:
-        if key in row:
-            return row[key]
-
-        key_lc = key.lower()
-        for row_key, row_value in row.items():
-            if str(row_key).lower() == key_lc:
-                return row_value
-        return None
-
     @staticmethod
     def _resolve_path(path_value: str) -> Path:
         path = Path(path_value)
@@ -9,14 +9,22 @@ Uses ReportLab (Platypus) for enterprise-safe rendering.
 
 from __future__ import annotations
 
+import copy
+from functools import lru_cache
 from io import BytesIO
-from typing import Iterable
+from os import PathLike
+from pathlib import Path
+from typing import BinaryIO, Iterable, List, Union
+from xml.sax.saxutils import escape
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT
+from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate,
+    BaseDocTemplate,
+    Frame,
+    PageTemplate,
     Paragraph,
     Spacer,
     Table,
@@ -28,37 +36,104 @@ from app.models.vin import VinInterpretation
 from app.models.cohort import CohortInterpretation
 
 
+# Destination for write_*_report: a filesystem path or an open binary handle.
+PdfTarget = Union[str, PathLike, BinaryIO]
+
+def _build_stylesheet():
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            name="Header",
+            fontSize=16,
+            spaceAfter=14,
+            alignment=TA_LEFT,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="Body",
+            fontSize=10,
+            spaceAfter=8,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="Small",
+            fontSize=8,
+            textColor=colors.grey,
+        )
+    )
+    return styles
+
+
+# Styles are immutable once built, so one stylesheet serves every exporter.
+_STYLES = _build_stylesheet()
+_BODY_STYLE = _STYLES["Body"]
+_SMALL_STYLE = _STYLES["Small"]
+
+_EVIDENCE_TABLE_HEADER = ("Signal", "Confidence")
+_METRICS_TABLE_HEADER = ("Metric", "Value")
+
+# EvidenceItem.confidence is validated to [0, 1], so every truncated
+# percentage is an index into this table.
+_PCT = tuple(f"{pct}%" for pct in range(101))
+
+# Shared by evidence and metrics tables; Table.setStyle only reads commands.
+_TABLE_STYLE = TableStyle([
+    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+    ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
+    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
+])
+
+
+@lru_cache(maxsize=256)
+def _para_template(text: str, style_name: str) -> Paragraph:
+    return Paragraph(text, _STYLES[style_name])
+
+
+def _para(text: str, style_name: str) -> Paragraph:
+    """
+    Paragraph for fixed markup, parsed once per (text, style).
+
+    Flowables carry layout state and may appear in a story only once, so
+    callers get a shallow copy of the never-rendered cached template.
+    """
+    return copy.copy(_para_template(text, style_name))
+
+
+# Page geometry matches SimpleDocTemplate's A4 defaults (1" margins) and is
+# computed once. Frames carry per-build layout state, so each document gets
+# its own Frame/PageTemplate built from these bounds.
+_PAGE_SIZE = A4
+_MARGIN = inch
+_FRAME_BOUNDS = (
+    _MARGIN,
+    _MARGIN,
+    _PAGE_SIZE[0] - 2 * _MARGIN,
+    _PAGE_SIZE[1] - 2 * _MARGIN,
+)
+
+
+def _new_document(target: Union[str, BinaryIO]) -> BaseDocTemplate:
+    return BaseDocTemplate(
+        target,
+        pagesize=_PAGE_SIZE,
+        leftMargin=_MARGIN,
+        rightMargin=_MARGIN,
+        topMargin=_MARGIN,
+        bottomMargin=_MARGIN,
+        pageTemplates=[
+            PageTemplate(id="normal", frames=[Frame(*_FRAME_BOUNDS, id="normal")])
+        ],
+    )
+
+
 class PdfExporterService:
     """
     Responsible for rendering PDF reports from
     interpretation models.
     """
 
-    def __init__(self) -> None:
-        self._styles = getSampleStyleSheet()
-        self._styles.add(
-            ParagraphStyle(
-                name="Header",
-                fontSize=16,
-                spaceAfter=14,
-                alignment=TA_LEFT,
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                name="Body",
-                fontSize=10,
-                spaceAfter=8,
-            )
-        )
-        self._styles.add(
-            ParagraphStyle(
-                name="Small",
-                fontSize=8,
-                textColor=colors.grey,
-            )
-        )
-
     # ---------------------------------------------------------
     # Public API
     # ---------------------------------------------------------
@@ -70,19 +145,61 @@ class PdfExporterService:
         """
         Generate a VIN-level PDF report.
         """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
+        return self._render_to_bytes(self._vin_story(interpretation))
+
+    def export_cohort_report(
+        self,
+        interpretation: CohortInterpretation,
+    ) -> bytes:
+        """
+        Generate a cohort-level PDF report.
+        """
+        return self._render_to_bytes(self._cohort_story(interpretation))
+
+    def write_vin_report(
+        self,
+        interpretation: VinInterpretation,
+        output: PdfTarget,
+    ) -> int:
+        """
+        Render a VIN-level PDF report straight to `output`.
+
+        `output` may be a path or a writable binary file object; either way
+        the document is never materialized in memory. Returns the number of
+        bytes written.
+        """
+        return self._render_to_file(self._vin_story(interpretation), output)
+
+    def write_cohort_report(
+        self,
+        interpretation: CohortInterpretation,
+        output: PdfTarget,
+    ) -> int:
+        """
+        Render a cohort-level PDF report straight to `output`.
+
+        `output` may be a path or a writable binary file object; either way
+        the document is never materialized in memory. Returns the number of
+        bytes written.
+        """
+        return self._render_to_file(self._cohort_story(interpretation), output)
+
+    # ---------------------------------------------------------
+    # Document assembly
+    # ---------------------------------------------------------
+
+    def _vin_story(self, interpretation: VinInterpretation) -> List:
         story = []
 
         story.extend(self._render_header(
             title="VIN Predictive Maintenance Report",
-            subtitle=f"VIN: {interpretation.vin}",
+            subtitle=f"VIN: {escape(interpretation.vin)}",
             model_version=interpretation.model_version,
         ))
 
         story.append(Paragraph(
-            f"<b>Summary</b><br/>{interpretation.summary}",
-            self._styles["Body"],
+            f"<b>Summary</b><br/>{escape(interpretation.summary)}",
+            _BODY_STYLE,
         ))
 
         story.append(Spacer(1, 12))
@@ -90,30 +207,20 @@ class PdfExporterService:
         story.extend(self._render_recommendations(
             interpretation.recommendations
         ))
+        return story
 
-        doc.build(story)
-        return buffer.getvalue()
-
-    def export_cohort_report(
-        self,
-        interpretation: CohortInterpretation,
-    ) -> bytes:
-        """
-        Generate a cohort-level PDF report.
-        """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
+    def _cohort_story(self, interpretation: CohortInterpretation) -> List:
         story = []
 
         story.extend(self._render_header(
             title="Cohort Predictive Maintenance Report",
-            subtitle=f"Cohort: {interpretation.cohort_id}",
+            subtitle=f"Cohort: {escape(interpretation.cohort_id)}",
             model_version=interpretation.model_version,
         ))
 
         story.append(Paragraph(
-            f"<b>Summary</b><br/>{interpretation.summary}",
-            self._styles["Body"],
+            f"<b>Summary</b><br/>{escape(interpretation.summary)}",
+            _BODY_STYLE,
         ))
 
         story.append(Spacer(1, 12))
@@ -121,10 +228,27 @@ class PdfExporterService:
         story.extend(self._render_metrics(
             interpretation.metrics
         ))
+        return story
 
-        doc.build(story)
+    @staticmethod
+    def _render_to_bytes(story: List) -> bytes:
+        buffer = BytesIO()
+        _new_document(buffer).build(story)
         return buffer.getvalue()
 
+    @staticmethod
+    def _render_to_file(story: List, output: PdfTarget) -> int:
+        # ReportLab streams to the target itself, so the document is never
+        # held in memory as a second in-process copy.
+        if hasattr(output, "write"):
+            start = output.tell()
+            _new_document(output).build(story)
+            return output.tell() - start
+
+        path = Path(output)
+        _new_document(str(path)).build(story)
+        return path.stat().st_size
+
     # ---------------------------------------------------------
     # Internal render helpers
     # ---------------------------------------------------------
@@ -137,64 +261,55 @@ class PdfExporterService:
         model_version: str,
     ) -> Iterable:
         return [
-            Paragraph(title, self._styles["Header"]),
-            Paragraph(subtitle, self._styles["Small"]),
-            Paragraph(f"Model version: {model_version}", self._styles["Small"]),
+            _para(title, "Header"),
+            Paragraph(subtitle, _SMALL_STYLE),
+            Paragraph(f"Model version: {escape(model_version)}", _SMALL_STYLE),
             Spacer(1, 16),
         ]
 
     def _render_recommendations(self, recommendations) -> Iterable:
         story = [
-            Paragraph("<b>Recommended Actions</b>", self._styles["Body"]),
+            _para("<b>Recommended Actions</b>", "Body"),
             Spacer(1, 6),
         ]
 
+        append = story.append
+        body_style = _BODY_STYLE
         for rec in recommendations:
-            story.append(Paragraph(
-                f"<b>{rec.title}</b> ({rec.urgency})",
-                self._styles["Body"],
-            ))
-            story.append(Paragraph(
-                rec.rationale,
-                self._styles["Body"],
+            # Model text is escaped so stray "<" or "&" cannot break (or inject)
+            # ReportLab markup; heading and rationale share one Paragraph parse.
+            append(Paragraph(
+                f"<b>{escape(rec.title)}</b> ({escape(rec.urgency)})"
+                f"<br/>{escape(rec.rationale)}",
+                body_style,
             ))
 
             if rec.evidence:
-                table_data = [["Signal", "Confidence"]]
-                for ev in rec.evidence:
-                    table_data.append([
-                        ev.signal_code,
-                        f"{int(ev.confidence * 100)}%",
-                    ])
-
-                table = Table(table_data, hAlign="LEFT")
-                table.setStyle(TableStyle([
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
-                    ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ]))
-                story.append(table)
-
-            story.append(Spacer(1, 10))
+                table = Table(
+                    [_EVIDENCE_TABLE_HEADER] + [
+                        [ev.signal_code, _PCT[int(ev.confidence * 100)]]
+                        for ev in rec.evidence
+                    ],
+                    hAlign="LEFT",
+                )
+                table.setStyle(_TABLE_STYLE)
+                append(table)
+
+            append(Spacer(1, 10))
 
         return story
 
     def _render_metrics(self, metrics) -> Iterable:
         story = [
-            Paragraph("<b>Cohort Metrics</b>", self._styles["Body"]),
+            _para("<b>Cohort Metrics</b>", "Body"),
             Spacer(1, 6),
         ]
 
-        table_data = [["Metric", "Value"]]
-        for m in metrics:
-            table_data.append([m.name, str(m.value)])
-
-        table = Table(table_data, hAlign="LEFT")
-        table.setStyle(TableStyle([
-            ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
-            ("BACKGROUND", (0, 0), (-1, 0), colors.whitesmoke),
-            ("FONT", (0, 0), (-1, 0), "Helvetica-Bold"),
-        ]))
+        table = Table(
+            [_METRICS_TABLE_HEADER] + [[m.name, str(m.value)] for m in metrics],
+            hAlign="LEFT",
+        )
+        table.setStyle(_TABLE_STYLE)
 
         story.append(table)
         return story
@@ -8,9 +8,12 @@ human-friendly language. Supports YAML/JSON assets stored in `data/reference`.
 from __future__ import annotations
 
 import json
-from functools import lru_cache
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from app.utils.config import load_config
 from app.utils.logger import get_logger, log_event
@@ -22,6 +25,222 @@ class ReferenceLoaderError(RuntimeError):
     pass
 
 
+_REFERENCE_FILES = {
+    "hi_catalog": "ref_hi_catalog.yaml",
+    "hi_family_map": "ref_hi_family_map.yaml",
+    "confidence_map": "ref_confidence_map.yaml",
+}
+
+
+_FileSignature = Tuple[str, Optional[int], Optional[int]]
+_ConfidenceBucket = Tuple[float, float, str]
+
+_UNMAPPED_CONFIDENCE = "unmapped confidence"
+_NO_DESCRIPTION = "No description available"
+
+
+class _ReferenceData:
+    """
+    Parsed bundle for one reference directory plus lookups derived from it.
+    """
+
+    __slots__ = (
+        "signature",
+        "bundle",
+        "reference_map",
+        "confidence_buckets",
+        "confidence_mins",
+    )
+
+    def __init__(
+        self,
+        signature: Tuple[_FileSignature, ...],
+        bundle: Mapping[str, Mapping[str, Any]],
+    ) -> None:
+        self.signature = signature
+        self.bundle = bundle
+        self.reference_map = _merge_reference_map(bundle)
+        self.confidence_buckets, self.confidence_mins = _build_confidence_buckets(
+            bundle["confidence_map"]
+        )
+
+
+def _build_confidence_buckets(
+    confidence_map: Mapping[str, Any],
+) -> Tuple[Tuple[_ConfidenceBucket, ...], Optional[Tuple[float, ...]]]:
+    """
+    Convert confidence ranges to (min, max, label) tuples once.
+
+    Non-overlapping ranges are sorted by `min` and returned with a parallel
+    tuple of minimums for bisection. Overlapping ranges keep file order
+    (first match wins) and return no minimums, signalling a linear scan.
+    """
+    ranges = confidence_map.get("ranges")
+    if not isinstance(ranges, list):
+        return (), None
+
+    try:
+        buckets = tuple(
+            (
+                float(bucket.get("min", 0.0)),
+                float(bucket.get("max", 1.0)),
+                str(bucket.get("label", _UNMAPPED_CONFIDENCE)),
+            )
+            for bucket in ranges
+            if isinstance(bucket, dict)
+        )
+    except (TypeError, ValueError) as exc:
+        raise ReferenceLoaderError("Confidence ranges must have numeric bounds") from exc
+
+    ordered = tuple(sorted(buckets, key=lambda bucket: bucket[0]))
+    for previous, current in zip(ordered, ordered[1:]):
+        if current[0] <= previous[1]:
+            return buckets, None
+    return ordered, tuple(bucket[0] for bucket in ordered)
+
+
+def _merge_reference_map(
+    bundle: Mapping[str, Mapping[str, Any]],
+) -> Mapping[str, Mapping[str, Any]]:
+    catalog = bundle.get("hi_catalog", {})
+    families = bundle.get("hi_family_map", {})
+
+    merged: Dict[str, Dict[str, Any]] = {
+        code: {
+            "description": entry.get("description") or _NO_DESCRIPTION,
+            "family": families.get(code, "UNKNOWN"),
+        }
+        for code, entry in catalog.items()
+    }
+
+    # Ensure family map-only entries still exist. Usually every family code is
+    # also in the catalog, so the set difference lets the loop be skipped.
+    family_only = families.keys() - catalog.keys()
+    if family_only:
+        for code, family in families.items():
+            if code in family_only:
+                merged[code] = {
+                    "description": _NO_DESCRIPTION,
+                    "family": family,
+                }
+
+    return MappingProxyType(
+        {code: MappingProxyType(entry) for code, entry in merged.items()}
+    )
+
+
+# reference_dir -> parsed reference data, revalidated by file signature
+_REFERENCE_CACHE: Dict[str, _ReferenceData] = {}
+_REFERENCE_CACHE_LOCK = threading.Lock()
+
+
+def _bundle_signature(root: Path) -> Tuple[_FileSignature, ...]:
+    signature = []
+    for filename in _REFERENCE_FILES.values():
+        # JSON sidecars are included because _read_mapping may prefer them.
+        for path in (root / filename, (root / filename).with_suffix(".json")):
+            try:
+                stat = path.stat()
+            except OSError:
+                signature.append((path.name, None, None))
+            else:
+                signature.append((path.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _load_reference_data(reference_dir: str) -> _ReferenceData:
+    """
+    Return parsed reference data for `reference_dir`, re-reading it only when
+    a reference file's mtime or size has changed since the last parse.
+    """
+    root = Path(reference_dir)
+    signature = _bundle_signature(root)
+
+    cached = _REFERENCE_CACHE.get(reference_dir)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    with _REFERENCE_CACHE_LOCK:
+        cached = _REFERENCE_CACHE.get(reference_dir)
+        if cached is not None and cached.signature == signature:
+            return cached
+        data = _ReferenceData(signature, _parse_bundle(root))
+        _REFERENCE_CACHE[reference_dir] = data
+        return data
+
+
+def _parse_bundle(root: Path) -> Mapping[str, Mapping[str, Any]]:
+    # The files are independent and libyaml releases the GIL while parsing,
+    # so reading them concurrently overlaps both I/O and parse time.
+    with ThreadPoolExecutor(
+        max_workers=len(_REFERENCE_FILES),
+        thread_name_prefix="reference-loader",
+    ) as executor:
+        mappings = executor.map(
+            _read_mapping,
+            [root / filename for filename in _REFERENCE_FILES.values()],
+        )
+        raw = dict(zip(_REFERENCE_FILES, mappings))
+    # Shorthand catalog entries (`CODE: description`) are expanded to the
+    # mapping form here, so every consumer sees one entry shape.
+    raw["hi_catalog"] = {
+        code: entry if isinstance(entry, dict) else {"description": str(entry)}
+        for code, entry in raw["hi_catalog"].items()
+    }
+    bundle = {key: MappingProxyType(mapping) for key, mapping in raw.items()}
+
+    log_event(
+        logger,
+        "Reference dictionaries loaded",
+        extra={
+            "reference_dir": str(root),
+            "catalog_size": len(bundle["hi_catalog"]),
+            "family_size": len(bundle["hi_family_map"]),
+            "confidence_size": len(bundle["confidence_map"]),
+        },
+    )
+
+    return MappingProxyType(bundle)
+
+
+def _read_mapping(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        raise ReferenceLoaderError(f"Missing reference file: {path}")
+
+    # A pre-converted JSON sidecar skips YAML parsing entirely, as long as
+    # it is at least as new as the YAML source it was generated from.
+    sidecar = path.with_suffix(".json")
+    if (
+        path.suffix.lower() != ".json"
+        and sidecar.exists()
+        and sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns
+    ):
+        path = sidecar
+
+    if path.suffix.lower() == ".json":
+        with path.open("r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    else:
+        try:
+            import yaml
+        except Exception as exc:
+            raise ReferenceLoaderError(
+                "PyYAML is required to load YAML reference files."
+            ) from exc
+
+        # libyaml's C loader when PyYAML was built with it.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with path.open("r", encoding="utf-8") as handle:
+            data = yaml.load(handle, Loader=loader)
+
+    if not isinstance(data, dict):
+        raise ReferenceLoaderError(
+            f"Reference file must contain a mapping object: {path}"
+        )
+
+    return data
+
+
 class ReferenceLoader:
     def __init__(self, reference_dir: Optional[Path] = None) -> None:
         config = load_config()
@@ -30,109 +249,46 @@ class ReferenceLoader:
         else:
             self._reference_dir = self._resolve_path(config.data.reference_dir)
 
-    @lru_cache(maxsize=1)
-    def load_bundle(self) -> Dict[str, Dict[str, Any]]:
+    def load_bundle(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Load all reference dictionaries from disk.
-        """
-        files = {
-            "hi_catalog": "ref_hi_catalog.yaml",
-            "hi_family_map": "ref_hi_family_map.yaml",
-            "confidence_map": "ref_confidence_map.yaml",
-        }
 
-        bundle: Dict[str, Dict[str, Any]] = {}
-        for key, filename in files.items():
-            path = self._reference_dir / filename
-            bundle[key] = self._read_mapping(path)
-
-        log_event(
-            logger,
-            "Reference dictionaries loaded",
-            extra={
-                "reference_dir": str(self._reference_dir),
-                "catalog_size": len(bundle["hi_catalog"]),
-                "family_size": len(bundle["hi_family_map"]),
-                "confidence_size": len(bundle["confidence_map"]),
-            },
-        )
-
-        return bundle
+        Bundles are parsed once per reference directory and shared by every
+        loader in the process; the returned mappings are read-only views.
+        """
+        return self._reference_data().bundle
 
-    def load_reference_map(self) -> Dict[str, Dict[str, Any]]:
+    def load_reference_map(self) -> Mapping[str, Mapping[str, Any]]:
         """
         Merge catalog and family dictionaries into a code-indexed map.
-        """
-        bundle = self.load_bundle()
-        catalog = bundle.get("hi_catalog", {})
-        families = bundle.get("hi_family_map", {})
 
-        merged: Dict[str, Dict[str, Any]] = {}
-
-        for code, raw in catalog.items():
-            description = (
-                raw.get("description")
-                if isinstance(raw, dict)
-                else str(raw)
-            )
-            merged[code] = {
-                "description": description or "No description available",
-                "family": families.get(code, "UNKNOWN"),
-            }
-
-        # Ensure family map-only entries still exist.
-        for code, family in families.items():
-            if code not in merged:
-                merged[code] = {
-                    "description": "No description available",
-                    "family": family,
-                }
-
-        return merged
+        The merge runs once per parsed bundle; the result is a read-only view
+        shared across calls.
+        """
+        return self._reference_data().reference_map
 
     def confidence_label(self, score: float) -> str:
         """
         Map confidence scores to human-readable labels.
         """
-        confidence_map = self.load_bundle().get("confidence_map", {})
-        ranges = confidence_map.get("ranges")
-        if not isinstance(ranges, list):
-            return "unmapped confidence"
-
-        for bucket in ranges:
-            if not isinstance(bucket, dict):
-                continue
-            minimum = float(bucket.get("min", 0.0))
-            maximum = float(bucket.get("max", 1.0))
-            if minimum <= score <= maximum:
-                return str(bucket.get("label", "unmapped confidence"))
-
-        return "unmapped confidence"
-
-    def _read_mapping(self, path: Path) -> Dict[str, Any]:
-        if not path.exists():
-            raise ReferenceLoaderError(f"Missing reference file: {path}")
-
-        if path.suffix.lower() == ".json":
-            with path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-        else:
-            try:
-                import yaml
-            except Exception as exc:
-                raise ReferenceLoaderError(
-                    "PyYAML is required to load YAML reference files."
-                ) from exc
+        data = self._reference_data()
+        buckets = data.confidence_buckets
 
-            with path.open("r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle)
+        if data.confidence_mins is None:
+            for minimum, maximum, label in buckets:
+                if minimum <= score <= maximum:
+                    return label
+            return _UNMAPPED_CONFIDENCE
 
-        if not isinstance(data, dict):
-            raise ReferenceLoaderError(
-                f"Reference file must contain a mapping object: {path}"
-            )
+        idx = bisect_right(data.confidence_mins, score) - 1
+        if idx >= 0:
+            _, maximum, label = buckets[idx]
+            if score <= maximum:
+                return label
+        return _UNMAPPED_CONFIDENCE
 
-        return data
+    def _reference_data(self) -> _ReferenceData:
+        return _load_reference_data(str(self._reference_dir))
 
     @staticmethod
     def _resolve_path(path_value: str) -> Path:
@@ -0,0 +1,12 @@
+"""
+Shared backend test setup.
+"""
+
+from __future__ import annotations
+
+import os
+
+# Set before any app module builds its logger, so records are written on the
+# test's own thread and captured with it instead of surfacing later from the
+# queue listener.
+os.environ.setdefault("LOG_SYNC", "true")
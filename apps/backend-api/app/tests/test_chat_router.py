@@ -0,0 +1,77 @@
+"""
+Chat router streaming tests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+
+import httpx
+from fastapi import FastAPI
+
+from app.routers import chat
+
+
+def _stream_events(monkeypatch, reply_chunks):
+    monkeypatch.setattr(chat.genai_service, "stream_chat_reply", reply_chunks)
+
+    app = FastAPI()
+    app.include_router(chat.router)
+
+    async def _post():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/chat/stream",
+                json={"message": "what is the risk?"},
+                headers={"x-request-id": "req-stream"},
+            )
+
+    response = asyncio.run(_post())
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return [
+        json.loads(block[len("data: "):])
+        for block in response.text.split("\n\n")
+        if block
+    ]
+
+
+def test_chat_stream_sends_chunks_then_done(monkeypatch):
+    def _reply(**_kwargs):
+        yield "VIN VIN123 "
+        yield "is HIGH."
+
+    assert _stream_events(monkeypatch, _reply) == [
+        {"type": "chat_chunk", "delta": "VIN VIN123 "},
+        {"type": "chat_chunk", "delta": "is HIGH."},
+        {"type": "chat_done", "request_id": "req-stream"},
+    ]
+
+
+def test_chat_stream_reports_mid_stream_failure_as_error(monkeypatch):
+    def _reply(**_kwargs):
+        yield "VIN VIN123 "
+        raise RuntimeError("provider dropped the stream")
+
+    logged = []
+    monkeypatch.setattr(
+        chat, "log_event", lambda _logger, message, **kwargs: logged.append((message, kwargs))
+    )
+    events = _stream_events(monkeypatch, _reply)
+
+    assert events[0] == {"type": "chat_chunk", "delta": "VIN VIN123 "}
+    assert events[-1]["type"] == "error"
+    assert events[-1]["request_id"] == "req-stream"
+    assert all(event["type"] != "chat_done" for event in events)
+    assert logged == [
+        (
+            "Chat stream failed",
+            {
+                "level": logging.ERROR,
+                "extra": {"request_id": "req-stream", "error_type": "RuntimeError"},
+            },
+        )
+    ]
@@ -6,14 +6,14 @@ from __future__ import annotations
 
 import pytest
 
-from app.utils.config import load_config
+from app.utils.config import load_config, reload_config, reset_config
 
 
 @pytest.fixture(autouse=True)
 def _reset_config_cache():
-    load_config.cache_clear()
+    reset_config()
     yield
-    load_config.cache_clear()
+    reset_config()
 
 
 def test_load_openai_compatible_llm(monkeypatch):
@@ -55,3 +55,36 @@ def test_emergency_fallback_flag(monkeypatch):
     cfg = load_config()
 
     assert cfg.features.allow_deterministic_fallback is True
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("t", True), (" Yes ", True), ("ON", True), ("0", False), ("off", False)],
+)
+def test_feature_flags_parse_truthy_values(monkeypatch, raw, expected):
+    monkeypatch.setenv("APP_ENV", "local")
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("FEATURE_PDF", raw)
+
+    cfg = load_config()
+
+    assert cfg.features.enable_pdf_export is expected
+
+
+def test_reload_config_revalidates_and_keeps_previous_on_error(monkeypatch):
+    monkeypatch.setenv("APP_ENV", "local")
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("FEATURE_PDF", "true")
+    original = load_config()
+
+    monkeypatch.setenv("FEATURE_PDF", "false")
+    assert load_config() is original
+
+    reloaded = reload_config()
+    assert reloaded.features.enable_pdf_export is False
+    assert load_config() is reloaded
+
+    monkeypatch.setenv("MART_QUERY_LIMIT", "0")
+    with pytest.raises(RuntimeError, match="Invalid configuration"):
+        reload_config()
+    assert load_config() is reloaded
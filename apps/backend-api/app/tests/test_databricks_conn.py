@@ -0,0 +1,204 @@
+"""
+DatabricksClient connection tests.
+
+A fake connector module replaces databricks-sql-connector so the retry
+ladder can be exercised without a warehouse.
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import SecretStr
+
+from app.utils import databricks_conn
+from app.utils.config import DatabricksConfig
+from app.utils.databricks_conn import DatabricksClient, DatabricksConnectionError
+
+
+class _FakeCursor:
+    def __init__(self, rows) -> None:
+        self._rows = list(rows)
+        self.description = [("VIN",), ("HI_CODE",)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+    def execute(self, query, params=None) -> None:
+        self.query = query
+
+    def fetchmany(self, size):
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class _FakeConnection:
+    def __init__(self, rows=()) -> None:
+        self.closed = False
+        self._rows = rows
+
+    @property
+    def open(self) -> bool:
+        return not self.closed
+
+    def cursor(self):
+        return _FakeCursor(self._rows)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeSql:
+    def __init__(self, *, failures: int = 0, rows=()) -> None:
+        self._failures = failures
+        self._rows = rows
+        self.attempts = 0
+        self.connections = []
+
+    def connect(self, **kwargs):
+        self.attempts += 1
+        if self.attempts <= self._failures:
+            raise ConnectionError("warehouse unavailable")
+        conn = _FakeConnection(self._rows)
+        self.connections.append(conn)
+        return conn
+
+
+@pytest.fixture
+def client():
+    client = DatabricksClient()
+    client._config = DatabricksConfig(
+        host="adb.example.net",
+        http_path="/sql/1.0/warehouses/test",
+        token=SecretStr("test-token"),
+        catalog="main",
+        schema_name="telemetry",
+    )
+    return client
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(databricks_conn.time, "sleep", recorded.append)
+    return recorded
+
+
+def test_connect_retries_with_backoff_schedule(client, sleeps, monkeypatch):
+    fake_sql = _FakeSql(failures=2)
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+
+    with client.connect(retries=3, retry_backoff=2.0) as conn:
+        assert not conn.closed
+
+    assert fake_sql.attempts == 3
+    assert sleeps == [2.0, 4.0]
+
+
+def test_connect_does_not_sleep_after_final_attempt(client, sleeps, monkeypatch):
+    fake_sql = _FakeSql(failures=3)
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+
+    with pytest.raises(DatabricksConnectionError):
+        with client.connect(retries=3, retry_backoff=2.0):
+            pass
+
+    assert fake_sql.attempts == 3
+    assert sleeps == [2.0, 4.0]
+
+
+def test_connect_does_not_retry_caller_errors(client, sleeps, monkeypatch):
+    fake_sql = _FakeSql(failures=0)
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+
+    with pytest.raises(KeyError):
+        with client.connect():
+            raise KeyError("row")
+
+    assert fake_sql.attempts == 1
+    assert fake_sql.connections[0].closed
+    assert sleeps == []
+
+
+def test_execute_query_yields_batches(client, monkeypatch):
+    rows = [(f"VIN{idx}", "HI-4302") for idx in range(5)]
+    fake_sql = _FakeSql(rows=rows)
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+
+    batches = list(client.execute_query("SELECT * FROM t", batch_size=2))
+
+    assert [len(batch) for _, batch in batches] == [2, 2, 1]
+    assert batches[0][0] == ["VIN", "HI_CODE"]
+    assert not fake_sql.connections[0].closed
+
+
+def test_execute_query_all_and_stream_query_share_batches(client, monkeypatch):
+    rows = [("VIN1", "HI-4302"), ("VIN2", "HI-1001")]
+    monkeypatch.setattr(databricks_conn, "_sql", _FakeSql(rows=rows))
+
+    assert client.execute_query_all("SELECT * FROM t") == (["VIN", "HI_CODE"], rows)
+    assert list(client.stream_query("SELECT * FROM t", lowercase_columns=True)) == [
+        {"vin": "VIN1", "hi_code": "HI-4302"},
+        {"vin": "VIN2", "hi_code": "HI-1001"},
+    ]
+
+
+def test_execute_query_all_keeps_columns_for_empty_result(client, monkeypatch):
+    monkeypatch.setattr(databricks_conn, "_sql", _FakeSql(rows=()))
+
+    assert client.execute_query_all("SELECT * FROM t") == (["VIN", "HI_CODE"], [])
+    assert list(client.stream_query("SELECT * FROM t")) == []
+
+
+@pytest.mark.parametrize("query", ["SELECT 1", "  select * FROM t", "\n\tSelect\n1"])
+def test_read_only_guard_accepts_select(query):
+    DatabricksClient._ensure_read_only(query)
+
+
+@pytest.mark.parametrize("query", ["DELETE FROM t", "selective_purge()", "-- x\nSELECT 1"])
+def test_read_only_guard_rejects_non_select(query):
+    with pytest.raises(ValueError, match="Only SELECT queries are allowed"):
+        DatabricksClient._ensure_read_only(query)
+
+
+def test_connect_reuses_pooled_connections_per_tag(client, sleeps, monkeypatch):
+    fake_sql = _FakeSql()
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+
+    with client.connect(query_tag="mh_snapshot") as first:
+        pass
+    with client.connect(query_tag="mh_snapshot") as second:
+        pass
+    with client.connect(query_tag="cohort_metrics") as other:
+        pass
+
+    assert first is second
+    assert other is not first
+    assert fake_sql.attempts == 2
+
+    first.closed = True
+    with client.connect(query_tag="mh_snapshot") as replacement:
+        assert replacement is not first
+    assert fake_sql.attempts == 3
+
+    client.close()
+    assert replacement.closed and other.closed
+
+
+def test_connect_discards_connections_idle_past_cutoff(client, sleeps, monkeypatch):
+    fake_sql = _FakeSql()
+    monkeypatch.setattr(databricks_conn, "_sql", fake_sql)
+    now = [1000.0]
+    monkeypatch.setattr(databricks_conn.time, "monotonic", lambda: now[0])
+
+    with client.connect(query_tag="mh_snapshot") as first:
+        pass
+    now[0] += databricks_conn._POOL_MAX_IDLE_SECONDS + 1
+    with client.connect(query_tag="mh_snapshot") as second:
+        pass
+
+    assert second is not first
+    assert first.closed
+    assert fake_sql.attempts == 2
@@ -12,17 +12,17 @@ import pytest
 
 from app.models.vin import VinInterpretation
 from app.models.cohort import CohortInterpretation, CohortListItem
-from app.services.genai_interpreter import GenAIInterpreter
-from app.utils.config import load_config
+from app.services.genai_interpreter import GenAIInterpreter, get_interpreter_service
+from app.utils.config import reset_config
 
 
 @pytest.fixture(autouse=True)
 def _local_runtime_flags(monkeypatch):
     monkeypatch.setenv("FEATURE_LANGGRAPH", "true")
     monkeypatch.setenv("FEATURE_ALLOW_DETERMINISTIC_FALLBACK", "true")
-    load_config.cache_clear()
+    reset_config()
     yield
-    load_config.cache_clear()
+    reset_config()
 
 
 def test_interpret_vin_end_to_end(monkeypatch):
@@ -79,7 +79,7 @@ def test_interpret_cohort_end_to_end(monkeypatch):
                 "title": "Fuel system anomaly spike",
                 "description": "Unusual increase in fuel system alerts",
                 "affected_vin_count": 8,
-                "severity": "HIGH",
+                "severity": "high",
                 "related_signals": ["HI-4302"],
             }
         ]
@@ -93,6 +93,8 @@ def test_interpret_cohort_end_to_end(monkeypatch):
     assert isinstance(result, CohortInterpretation)
     assert result.cohort_id == "TEST_COHORT"
     assert result.anomalies
+    assert result.anomalies[0].severity == "HIGH"
+    assert "high-severity" in result.summary
     assert result.model_version == "test"
 
 
@@ -170,3 +172,15 @@ def test_list_cohorts_returns_typed_registry_items(monkeypatch):
     assert all(isinstance(item, CohortListItem) for item in result)
     assert result[0].cohort_id == "EURO6-DIESEL"
     assert result[0].cohort_description == "Euro 6 fleet"
+
+
+def test_get_interpreter_service_reuses_instance_per_model_version():
+    get_interpreter_service.cache_clear()
+
+    first = get_interpreter_service("test")
+    second = get_interpreter_service("test")
+    other = get_interpreter_service("other")
+
+    assert first is second
+    assert other is not first
+    get_interpreter_service.cache_clear()
@@ -0,0 +1,123 @@
+"""
+Logger factory and formatter tests.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+from datetime import datetime
+
+from app.utils.logger import (
+    JsonLogFormatter,
+    _sanitize,
+    get_logger,
+    log_event,
+    set_agent,
+    set_request_id,
+    set_vin,
+)
+
+
+def test_get_logger_is_keyed_by_name():
+    first = get_logger("tests.logger.first")
+    second = get_logger("tests.logger.second")
+
+    assert first is not second
+    assert first.name == "tests.logger.first"
+    assert second.name == "tests.logger.second"
+
+
+def test_get_logger_attaches_handler_once():
+    logger = get_logger("tests.logger.repeat")
+    get_logger("tests.logger.repeat")
+
+    assert logger is get_logger("tests.logger.repeat")
+    assert len(logger.handlers) == 1
+
+
+def test_loggers_write_synchronously_under_tests():
+    from app.utils import logger as logger_module
+
+    handler = get_logger("tests.logger.sync").handlers[0]
+
+    assert isinstance(handler, logging.StreamHandler)
+    assert logger_module._queue_listener is None
+
+
+def test_json_formatter_encodes_extra_fields():
+    record = logging.LogRecord(
+        "tests.logger.format", logging.INFO, __file__, 1, "hello", None, None
+    )
+    record.extra_fields = {"row_count": 3, "observed_at": datetime(2026, 2, 1), 7: "x"}
+
+    payload = json.loads(JsonLogFormatter().format(record))
+
+    assert payload["message"] == "hello"
+    assert payload["row_count"] == 3
+    assert payload["observed_at"].startswith("2026-02-01")
+    assert payload["timestamp"].endswith("Z")
+
+
+def test_log_context_fields_are_merged_and_cleared():
+    def _format_in_context():
+        set_request_id("req-1")
+        set_vin("WVWZZZ1KZ6W000001")
+        set_agent("vin_explainer")
+        set_vin(None)
+        record = logging.LogRecord(
+            "tests.logger.context", logging.INFO, __file__, 1, "hello", None, None
+        )
+        return json.loads(JsonLogFormatter().format(record))
+
+    payload = contextvars.copy_context().run(_format_in_context)
+
+    assert payload["request_id"] == "req-1"
+    assert payload["agent"] == "vin_explainer"
+    assert "vin" not in payload
+
+
+def test_plain_records_match_full_encoding():
+    def _format_both():
+        set_request_id("req-2")
+        formatter = JsonLogFormatter()
+        record = logging.LogRecord(
+            "tests.logger.plain", logging.WARNING, __file__, 7, 'say "hi"\n\u00e9', None, None
+        )
+        plain = formatter.format(record)
+        record.extra_fields = {"row_count": 1}
+        full = json.loads(formatter.format(record))
+        full.pop("row_count")
+        return plain, full
+
+    plain, full = contextvars.copy_context().run(_format_both)
+
+    assert json.loads(plain) == full
+    assert list(json.loads(plain)) == list(full)
+    assert json.loads(plain)["message"] == 'say "hi"\n\u00e9'
+
+
+def test_log_event_defers_message_formatting(monkeypatch):
+    class _Exploding:
+        def __str__(self) -> str:
+            raise AssertionError("formatted a filtered event")
+
+    logger = get_logger("tests.logger.lazy")
+    logger.setLevel(logging.INFO)
+    records = []
+    monkeypatch.setattr(logger, "handle", records.append)
+
+    log_event(logger, "skipped %s", _Exploding(), level=logging.DEBUG)
+    log_event(logger, "loaded %d rows from %s", 3, "mart")
+
+    assert [record.getMessage() for record in records] == ["loaded 3 rows from mart"]
+
+
+def test_sanitize_redacts_blocked_keys_case_insensitively():
+    assert _sanitize({"token": "t", "API_KEY": "k", "row_count": 2}) == {
+        "token": "***REDACTED***",
+        "API_KEY": "***REDACTED***",
+        "row_count": 2,
+    }
+    assert _sanitize({}) == {}
@@ -0,0 +1,260 @@
+"""
+MartLoader Databricks-mode tests.
+
+A fake SQL client stands in for the warehouse so query construction and
+result handling can be validated without network access.
+"""
+
+from __future__ import annotations
+
+import pyarrow as pa
+import pytest
+
+from app.services import mart_loader as mart_loader_module
+from app.services.mart_loader import ArrowRecords, MartLoader, MartLoaderError
+from app.utils.config import reload_config, reset_config
+
+
+class _FakeClient:
+    def __init__(self, table: pa.Table) -> None:
+        self._table = table
+        self.queries = []
+
+    def execute_query_arrow(self, query, *, query_tag=None, query_params=None):
+        self.queries.append((query, query_tag, query_params))
+        return self._table
+
+
+class _FakeStreamingClient:
+    def __init__(self, rows, *, fail_after=None) -> None:
+        self._rows = rows
+        self._fail_after = fail_after
+        self.queries = []
+
+    def stream_query(
+        self,
+        query,
+        *,
+        query_tag=None,
+        query_params=None,
+        lowercase_columns=False,
+    ):
+        self.queries.append((query, query_tag, query_params))
+        assert lowercase_columns
+        for idx, row in enumerate(self._rows):
+            if self._fail_after is not None and idx >= self._fail_after:
+                raise ConnectionError("warehouse dropped the connection")
+            yield row
+
+
+@pytest.fixture
+def databricks_loader(monkeypatch):
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    reset_config()
+
+    loader = MartLoader()
+    loader._config = loader._config.copy(
+        update={
+            "data": loader._config.data.copy(update={"source": "databricks"})
+        }
+    )
+    yield loader
+    reset_config()
+
+
+def test_arrow_records_iterates_rows_and_exposes_columns():
+    records = ArrowRecords(
+        pa.table({"metric_name": ["risk_high", "risk_low"], "metric_value": [3.0, 1.0]})
+    )
+
+    assert len(records) == 2
+    assert records.columns == ["metric_name", "metric_value"]
+    assert records.column("metric_value").to_pylist() == [3.0, 1.0]
+    assert list(records) == [
+        {"metric_name": "risk_high", "metric_value": 3.0},
+        {"metric_name": "risk_low", "metric_value": 1.0},
+    ]
+
+
+def test_mh_snapshot_reads_arrow_result(databricks_loader):
+    client = _FakeClient(
+        pa.table(
+            {
+                "vin": ["WVWZZZ1KZ6W000001", "WVWZZZ1KZ6W000001"],
+                "hi_code": ["HI-4302", None],
+                "confidence": [0.9, 0.4],
+                "observed_at": ["2026-02-01T00:00:00Z", "2026-02-01T01:00:00Z"],
+            }
+        )
+    )
+    databricks_loader._client = client
+
+    rows = databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+
+    assert rows == [
+        {
+            "vin": "WVWZZZ1KZ6W000001",
+            "hi_code": "HI-4302",
+            "confidence": 0.9,
+            "observed_at": "2026-02-01T00:00:00Z",
+        }
+    ]
+    query, query_tag, query_params = client.queries[0]
+    assert query.startswith("SELECT vin, hi_code, confidence, observed_at FROM ")
+    assert "WHERE vin IN (?)" in query
+    assert "WVWZZZ1KZ6W000001" not in query
+    assert query_tag == "mh_snapshot"
+    assert query_params == ["WVWZZZ1KZ6W000001"]
+
+
+def test_mh_snapshots_batch_vins_into_one_query(databricks_loader):
+    client = _FakeClient(
+        pa.table(
+            {
+                "vin": ["WVWZZZ1KZ6W000001", "WVWZZZ1KZ6W000002", "WVWZZZ1KZ6W000001"],
+                "hi_code": ["HI-4302", "HI-1001", "HI-4303"],
+                "confidence": [0.9, 0.5, 0.7],
+                "observed_at": ["2026-02-02", "2026-02-01", "2026-02-01"],
+            }
+        )
+    )
+    databricks_loader._client = client
+
+    grouped = databricks_loader.load_mh_snapshots(
+        ["wvwzzz1kz6w000001", "WVWZZZ1KZ6W000002", "WVWZZZ1KZ6W000003", "WVWZZZ1KZ6W000001"],
+        limit=10,
+    )
+
+    assert list(grouped) == ["WVWZZZ1KZ6W000001", "WVWZZZ1KZ6W000002", "WVWZZZ1KZ6W000003"]
+    assert [row["hi_code"] for row in grouped["WVWZZZ1KZ6W000001"]] == ["HI-4302", "HI-4303"]
+    assert [row["hi_code"] for row in grouped["WVWZZZ1KZ6W000002"]] == ["HI-1001"]
+    assert grouped["WVWZZZ1KZ6W000003"] == []
+
+    assert len(client.queries) == 1
+    query, _, query_params = client.queries[0]
+    assert "WHERE vin IN (?, ?, ?)" in query
+    assert "PARTITION BY vin ORDER BY observed_at DESC) <= 10" in query
+    assert query_params == ["WVWZZZ1KZ6W000001", "WVWZZZ1KZ6W000002", "WVWZZZ1KZ6W000003"]
+
+
+def test_vin_mart_results_are_cached_per_vin(databricks_loader):
+    client = _FakeClient(
+        pa.table(
+            {
+                "vin": ["WVWZZZ1KZ6W000001"],
+                "hi_code": ["HI-4302"],
+                "confidence": [0.9],
+                "observed_at": ["2026-02-01"],
+            }
+        )
+    )
+    databricks_loader._client = client
+
+    first = databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+    first[0]["hi_code"] = "mutated"
+    second = databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+    second[0]["hi_code"] = "mutated again"
+    first.clear()
+    grouped = databricks_loader.load_mh_snapshots(
+        ["WVWZZZ1KZ6W000001", "WVWZZZ1KZ6W000002"]
+    )
+
+    assert [row["hi_code"] for row in grouped["WVWZZZ1KZ6W000001"]] == ["HI-4302"]
+    assert len(client.queries) == 2
+    assert client.queries[1][2] == ["WVWZZZ1KZ6W000002"]
+
+    databricks_loader.clear_cache()
+    databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+    assert len(client.queries) == 3
+
+
+def test_reload_config_drops_cached_vin_mart_results(databricks_loader, monkeypatch):
+    client = _FakeClient(
+        pa.table(
+            {
+                "vin": ["WVWZZZ1KZ6W000001"],
+                "hi_code": ["HI-4302"],
+                "confidence": [0.9],
+                "observed_at": ["2026-02-01"],
+            }
+        )
+    )
+    databricks_loader._client = client
+    databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+
+    monkeypatch.setenv("MART_CACHE_TTL_SECONDS", "60")
+    reloaded = reload_config()
+
+    assert databricks_loader._config is reloaded
+    assert databricks_loader._mart_cache._ttl == 60.0
+    databricks_loader._config = reloaded.copy(
+        update={"data": reloaded.data.copy(update={"source": "databricks"})}
+    )
+    databricks_loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
+    assert len(client.queries) == 2
+
+
+def test_mart_queries_apply_row_limit(databricks_loader):
+    client = _FakeClient(
+        pa.table(
+            {
+                "title": ["Fuel cluster"],
+                "description": ["Spike"],
+                "affected_vin_count": [2],
+                "severity": ["HIGH"],
+            }
+        )
+    )
+    databricks_loader._client = client
+
+    databricks_loader.load_cohort_anomalies("EURO6-DIESEL")
+    databricks_loader.load_cohort_anomalies("EURO6-DIESEL", limit=25)
+    databricks_loader.load_cohort_metrics("EURO6-DIESEL")
+
+    assert client.queries[0][0].endswith(" LIMIT 500")
+    assert client.queries[1][0].endswith(" LIMIT 25")
+    assert "ORDER BY CASE upper(severity) WHEN 'HIGH' THEN 0" in client.queries[0][0]
+    assert "LIMIT" not in client.queries[2][0]
+
+
+def test_mart_rows_stream_without_arrow(databricks_loader, monkeypatch):
+    monkeypatch.setattr(mart_loader_module, "_ARROW_AVAILABLE", False)
+    client = _FakeStreamingClient(
+        [
+            {"metric_name": "risk_high", "metric_value": 3.0},
+            {"metric_name": None, "metric_value": 1.0},
+        ]
+    )
+    databricks_loader._client = client
+
+    rows = databricks_loader.load_cohort_metrics("EURO6-DIESEL")
+
+    assert rows == [{"metric_name": "risk_high", "metric_value": 3.0}]
+    assert client.queries[0][2] == ["EURO6-DIESEL"]
+
+
+def test_mart_stream_errors_raise_mart_loader_error(databricks_loader, monkeypatch):
+    monkeypatch.setattr(mart_loader_module, "_ARROW_AVAILABLE", False)
+    databricks_loader._client = _FakeStreamingClient(
+        [{"metric_name": "risk_high", "metric_value": 3.0}] * 3,
+        fail_after=1,
+    )
+
+    with pytest.raises(MartLoaderError):
+        databricks_loader.load_cohort_metrics("EURO6-DIESEL")
+
+
+def test_list_cohorts_dedupes_and_keeps_first_description(databricks_loader):
+    databricks_loader._client = _FakeClient(
+        pa.table(
+            {
+                "COHORT_ID": ["EURO6-DIESEL", "EURO6-DIESEL", "EV-2025", "!"],
+                "Description": ["  Euro 6 fleet ", "duplicate", None, "bad id"],
+            }
+        )
+    )
+
+    assert databricks_loader.list_cohorts() == [
+        {"cohort_id": "EURO6-DIESEL", "cohort_description": "Euro 6 fleet"},
+        {"cohort_id": "EV-2025", "cohort_description": None},
+    ]
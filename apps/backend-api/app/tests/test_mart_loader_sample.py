@@ -1,10 +1,11 @@
+import asyncio
 import json
 from pathlib import Path
 
 import pytest
 
-from app.services.mart_loader import MartLoader, MartLoaderError
-from app.utils.config import load_config
+from app.services.mart_loader import MartLoader, MartLoaderError, _MHRowSchema
+from app.utils.config import reset_config
 
 
 def test_mart_loader_reads_sample_mode(tmp_path: Path, monkeypatch):
@@ -34,12 +35,14 @@ def test_mart_loader_reads_sample_mode(tmp_path: Path, monkeypatch):
 
     monkeypatch.setenv("DATA_SOURCE", "sample")
     monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
-    load_config.cache_clear()
+    reset_config()
 
     loader = MartLoader()
     assert len(loader.load_mh_snapshot("WVWZZZ1KZ6W000001")) == 1
     assert len(loader.load_mp_triggers("WVWZZZ1KZ6W000001")) == 1
     assert len(loader.load_fim_root_causes("WVWZZZ1KZ6W000001")) == 1
+    bundle = asyncio.run(loader.load_vin_bundle("wvwzzz1kz6w000001"))
+    assert {key: len(rows) for key, rows in bundle.items()} == {"mh": 1, "mp": 1, "fim": 1}
     assert len(loader.load_cohort_metrics("EURO6-DIESEL")) == 1
     assert len(loader.load_cohort_anomalies("EURO6-DIESEL")) == 1
     cohorts = loader.list_cohorts()
@@ -49,7 +52,7 @@ def test_mart_loader_reads_sample_mode(tmp_path: Path, monkeypatch):
             "cohort_description": None,
         }
     ]
-    load_config.cache_clear()
+    reset_config()
 
 
 def test_mart_loader_drops_invalid_rows_when_not_strict(
@@ -87,14 +90,14 @@ def test_mart_loader_drops_invalid_rows_when_not_strict(
     monkeypatch.setenv("DATA_SOURCE", "sample")
     monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
     monkeypatch.setenv("APP_ENV", "local")
-    load_config.cache_clear()
+    reset_config()
 
     loader = MartLoader()
     rows = loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
 
     assert len(rows) == 1
     assert rows[0]["hi_code"] == "HI-4302"
-    load_config.cache_clear()
+    reset_config()
 
 
 def test_mart_loader_raises_on_invalid_row_in_strict_mode(
@@ -127,7 +130,7 @@ def test_mart_loader_raises_on_invalid_row_in_strict_mode(
     monkeypatch.setenv("DATA_SOURCE", "sample")
     monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
     monkeypatch.setenv("APP_ENV", "local")
-    load_config.cache_clear()
+    reset_config()
 
     loader = MartLoader()
     loader._config = loader._config.copy(
@@ -141,7 +144,7 @@ def test_mart_loader_raises_on_invalid_row_in_strict_mode(
     with pytest.raises(MartLoaderError):
         loader.load_mh_snapshot("WVWZZZ1KZ6W000001")
 
-    load_config.cache_clear()
+    reset_config()
 
 
 def test_mart_loader_rejects_invalid_sample_schema(
@@ -173,10 +176,108 @@ def test_mart_loader_rejects_invalid_sample_schema(
 
     monkeypatch.setenv("DATA_SOURCE", "sample")
     monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
-    load_config.cache_clear()
+    reset_config()
 
     loader = MartLoader()
     with pytest.raises(MartLoaderError):
         loader.load_cohort_metrics("EURO6-DIESEL")
 
-    load_config.cache_clear()
+    reset_config()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"vins": [{"vin": "WVWZZZ1KZ6W000001", "mh": "not-a-list"}]},
+        {"vins": [{"vin": "WVW"}]},
+        {"cohorts": ["EURO6-DIESEL"]},
+    ],
+)
+def test_mart_loader_rejects_malformed_sample_entries(
+    tmp_path: Path,
+    monkeypatch,
+    payload,
+):
+    sample_path = tmp_path / "sample_vin_data.json"
+    sample_path.write_text(json.dumps(payload), encoding="utf-8")
+
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
+    reset_config()
+
+    loader = MartLoader()
+    with pytest.raises(MartLoaderError, match="expected ingestion schema"):
+        loader.list_cohorts()
+
+    reset_config()
+
+
+def test_list_cohorts_reads_mixed_case_sample_keys(tmp_path: Path, monkeypatch):
+    sample_path = tmp_path / "sample_vin_data.json"
+    sample_path.write_text(
+        json.dumps(
+            {
+                "vins": [],
+                "cohorts": [
+                    {"cohort_id": "EURO6-DIESEL", "Cohort_Description": "Euro 6 fleet"},
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
+    reset_config()
+
+    loader = MartLoader()
+    assert loader.list_cohorts() == [
+        {"cohort_id": "EURO6-DIESEL", "cohort_description": "Euro 6 fleet"}
+    ]
+    reset_config()
+
+
+def test_mart_loader_accepts_utf8_bom_sample(tmp_path: Path, monkeypatch):
+    sample_path = tmp_path / "sample_vin_data.json"
+    payload = {
+        "vins": [
+            {
+                "vin": "WVWZZZ1KZ6W000001",
+                "mh": [{"hi_code": "HI-4302", "confidence": 0.9, "observed_at": "2026-02-01T00:00:00Z"}],
+            }
+        ],
+        "cohorts": [],
+    }
+    sample_path.write_bytes(b"\xef\xbb\xbf" + json.dumps(payload).encode("utf-8"))
+
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("SAMPLE_DATA_FILE", str(sample_path))
+    reset_config()
+
+    loader = MartLoader()
+    assert len(loader.load_mh_snapshot("WVWZZZ1KZ6W000001")) == 1
+    reset_config()
+
+
+def test_validate_rows_fast_path_matches_schema_validation(monkeypatch):
+    monkeypatch.setenv("DATA_SOURCE", "sample")
+    monkeypatch.setenv("APP_ENV", "local")
+    reset_config()
+
+    loader = MartLoader()
+    rows = loader._validate_rows(
+        [
+            {"hi_code": "HI-4302", "confidence": 0.9, "observed_at": "2026-02-01T00:00:00Z", "vin": None},
+            {"hi_code": "HI-4303", "confidence": "0.8", "observed_at": "2026-02-01T00:00:00Z"},
+            {"hi_code": "HI-4304", "confidence": 1.5, "observed_at": "2026-02-01T00:00:00Z"},
+            {"hi_code": "", "confidence": 0.9, "observed_at": "2026-02-01T00:00:00Z"},
+        ],
+        schema=_MHRowSchema,
+        dataset_name="mh_snapshot",
+    )
+
+    assert rows == [
+        {"hi_code": "HI-4302", "confidence": 0.9, "observed_at": "2026-02-01T00:00:00Z"},
+        {"hi_code": "HI-4303", "confidence": 0.8, "observed_at": "2026-02-01T00:00:00Z"},
+    ]
+    reset_config()
@@ -4,6 +4,8 @@ NarrativeComposer hybrid selection tests.
 
 from __future__ import annotations
 
+import pytest
+
 from app.workflows.narrative import NarrativeComposer
 
 
@@ -15,6 +17,24 @@ class _StaticChain:
         _ = payload
         return self._response
 
+    def stream(self, payload):  # pragma: no cover - tiny shim
+        _ = payload
+        yield from self._response.split(" ")
+
+
+class _PartialChain:
+    def stream(self, payload):  # pragma: no cover - tiny shim
+        _ = payload
+        yield "VIN VIN123"
+        raise RuntimeError("provider dropped the stream")
+
+
+class _FailingChain:
+    def stream(self, payload):  # pragma: no cover - tiny shim
+        _ = payload
+        raise RuntimeError("provider unavailable")
+        yield
+
 
 def test_hybrid_returns_deterministic_when_llm_disabled():
     composer = NarrativeComposer()
@@ -74,3 +94,155 @@ def test_hybrid_rejects_speculative_llm_candidate():
     )
 
     assert result == deterministic
+
+
+def test_identical_llm_prompts_are_served_from_cache():
+    class _CountingChain(_StaticChain):
+        calls = 0
+
+        def invoke(self, payload):
+            type(self).calls += 1
+            return super().invoke(payload)
+
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _CountingChain("VIN VIN123 is HIGH.")
+    evidence = [{"signal_code": "HI-4302", "confidence": 0.9}]
+
+    for _ in range(3):
+        assert composer.compose_vin_summary(
+            vin="VIN123", risk_level="HIGH", evidence=evidence
+        ) == "VIN VIN123 is HIGH."
+    composer.compose_vin_summary(vin="VIN123", risk_level="LOW", evidence=evidence)
+
+    assert _CountingChain.calls == 2
+
+
+def test_vin_summaries_share_cache_entries_across_vins():
+    class _EchoChain:
+        calls = 0
+
+        def invoke(self, payload):
+            type(self).calls += 1
+            return f"{payload['entity']} shows {payload['risk']} risk."
+
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _EchoChain()
+    evidence = [{"signal_code": "HI-4302", "confidence": 0.9}]
+
+    first = composer.compose_vin_summary(
+        vin="WVWZZZ1KZ6W000001", risk_level="HIGH", evidence=evidence
+    )
+    second = composer.compose_vin_summary(
+        vin="WVWZZZ1KZ6W000002", risk_level="HIGH", evidence=evidence
+    )
+
+    assert first == "VIN WVWZZZ1KZ6W000001 shows HIGH risk."
+    assert second == "VIN WVWZZZ1KZ6W000002 shows HIGH risk."
+    assert _EchoChain.calls == 1
+
+
+def test_vin_summaries_with_reformatted_vin_are_not_shared():
+    class _LowercaseChain:
+        calls = 0
+
+        def invoke(self, payload):
+            type(self).calls += 1
+            return f"{payload['entity'].lower()} shows {payload['risk']} risk."
+
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _LowercaseChain()
+    evidence = [{"signal_code": "HI-4302", "confidence": 0.9}]
+
+    first = composer.compose_vin_summary(
+        vin="WVWZZZ1KZ6W000001", risk_level="HIGH", evidence=evidence
+    )
+    second = composer.compose_vin_summary(
+        vin="WVWZZZ1KZ6W000002", risk_level="HIGH", evidence=evidence
+    )
+    repeat = composer.compose_vin_summary(
+        vin="WVWZZZ1KZ6W000001", risk_level="HIGH", evidence=evidence
+    )
+
+    assert first == repeat == "vin wvwzzz1kz6w000001 shows HIGH risk."
+    assert second == "vin wvwzzz1kz6w000002 shows HIGH risk."
+    assert _LowercaseChain.calls == 2
+
+
+def test_stream_forwards_llm_chunks():
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _StaticChain("VIN VIN123 is HIGH")
+
+    chunks = list(
+        composer.stream_chat_reply(
+            user_message="what is the risk?",
+            context={"vin": "VIN123", "risk_level": "HIGH"},
+            deterministic_reply="VIN VIN123 is currently assessed as HIGH.",
+        )
+    )
+
+    assert chunks == ["VIN", "VIN123", "is", "HIGH"]
+
+
+def test_stream_falls_back_to_deterministic_reply():
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _FailingChain()
+
+    chunks = list(
+        composer.stream_chat_reply(
+            user_message="what is the risk?",
+            context={"vin": "VIN123", "risk_level": "HIGH"},
+            deterministic_reply="",
+        )
+    )
+
+    assert chunks == [
+        "For VIN123, current risk context is HIGH. Available evidence sources: . "
+        "Ask about a specific signal or recommendation for more detail."
+    ]
+
+
+def test_stream_reraises_failure_after_first_chunk():
+    composer = NarrativeComposer()
+    composer._llm_enabled = True
+    composer._llm_chain = _PartialChain()
+
+    stream = composer.stream_chat_reply(
+        user_message="what is the risk?",
+        context={"vin": "VIN123", "risk_level": "HIGH"},
+        deterministic_reply="VIN VIN123 is currently assessed as HIGH.",
+    )
+
+    assert next(stream) == "VIN VIN123"
+    with pytest.raises(RuntimeError):
+        next(stream)
+
+
+def test_deterministic_summaries_follow_risk_templates():
+    composer = NarrativeComposer()
+    composer._llm_enabled = False
+    composer._llm_chain = None
+    evidence = [{"signal_code": "HI-{4302}", "confidence": 0.9}]
+
+    assert composer.compose_vin_summary(
+        vin="VIN123", risk_level="HIGH", evidence=evidence
+    ) == (
+        "VIN VIN123 shows multiple high-confidence predictive anomalies. "
+        "Dominant signals: HI-{4302} (90%)."
+    )
+    assert composer.compose_vin_summary(
+        vin="VIN123", risk_level="LOW", evidence=[]
+    ).endswith("Observed signals: none.")
+    assert composer.compose_cohort_summary(
+        cohort_id="EURO6-DIESEL",
+        high_anomaly_count=0,
+        total_anomaly_count=2,
+        top_metrics=[{"name": "risk_high", "value": 3}],
+    ) == (
+        "Cohort EURO6-DIESEL has emerging anomaly patterns that should be monitored. "
+        "Key metrics: risk_high=3."
+    )
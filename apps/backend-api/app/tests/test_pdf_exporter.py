@@ -0,0 +1,103 @@
+"""
+PdfExporterService tests.
+
+These tests validate that VIN and cohort reports render to well-formed
+PDF bytes and that file output matches the in-memory rendering.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.models.cohort import CohortInterpretation, CohortMetric
+from app.models.vin import EvidenceItem, Recommendation, VinInterpretation
+from app.services.pdf_exporter import PdfExporterService, _para
+
+
+@pytest.fixture
+def vin_interpretation():
+    return VinInterpretation(
+        vin="WVWZZZ1KZ6W000001",
+        summary="Fuel system degradation detected.",
+        risk_level="ELEVATED",
+        model_version="test",
+        recommendations=[
+            Recommendation(
+                title="Inspect high-pressure fuel pump",
+                rationale="Pressure deviation trend over the last week.",
+                urgency="HIGH",
+                suggested_action="Schedule workshop inspection",
+                evidence=[
+                    EvidenceItem(
+                        source_model="MH",
+                        signal_code="HI-4302",
+                        signal_description="Fuel rail pressure deviation",
+                        confidence=0.87,
+                        observed_at=datetime(2026, 2, 1),
+                    )
+                ],
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def cohort_interpretation():
+    return CohortInterpretation(
+        cohort_id="EURO6-DIESEL",
+        summary="Cohort is stable.",
+        model_version="test",
+        metrics=[
+            CohortMetric(name="risk_high", value=3.0, description="High-risk VIN count"),
+        ],
+    )
+
+
+def test_export_reports_return_pdf_bytes(vin_interpretation, cohort_interpretation):
+    exporter = PdfExporterService()
+
+    assert exporter.export_vin_report(vin_interpretation).startswith(b"%PDF")
+    assert exporter.export_cohort_report(cohort_interpretation).startswith(b"%PDF")
+
+
+def test_write_vin_report_streams_to_file(tmp_path, vin_interpretation):
+    exporter = PdfExporterService()
+    output_path = tmp_path / "vin_report.pdf"
+
+    written = exporter.write_vin_report(vin_interpretation, output_path)
+
+    assert written == output_path.stat().st_size
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_vin_report_escapes_markup_in_model_text(vin_interpretation):
+    exporter = PdfExporterService()
+    interpretation = vin_interpretation.copy(
+        update={"summary": "Pressure <5 bar & falling <b>"}
+    )
+
+    assert exporter.export_vin_report(interpretation).startswith(b"%PDF")
+
+
+def test_static_paragraphs_are_parsed_once_and_copied(vin_interpretation):
+    first = _para("<b>Recommended Actions</b>", "Body")
+    second = _para("<b>Recommended Actions</b>", "Body")
+
+    assert first is not second
+    assert first.frags is second.frags
+
+    exporter = PdfExporterService()
+    assert exporter.export_vin_report(vin_interpretation).startswith(b"%PDF")
+    assert exporter.export_vin_report(vin_interpretation).startswith(b"%PDF")
+
+
+def test_write_cohort_report_accepts_binary_handle(tmp_path, cohort_interpretation):
+    exporter = PdfExporterService()
+    output_path = tmp_path / "cohort_report.pdf"
+
+    with output_path.open("wb") as handle:
+        written = exporter.write_cohort_report(cohort_interpretation, handle)
+        assert not handle.closed
+
+    assert written == output_path.stat().st_size
+    assert output_path.read_bytes().startswith(b"%PDF")
@@ -1,6 +1,8 @@
 from pathlib import Path
 
-from app.services.reference_loader import ReferenceLoader
+import pytest
+
+from app.services.reference_loader import ReferenceLoader, ReferenceLoaderError
 
 
 def test_reference_loader_merges_catalog_and_family(tmp_path: Path):
@@ -9,7 +11,7 @@ def test_reference_loader_merges_catalog_and_family(tmp_path: Path):
         encoding="utf-8",
     )
     (tmp_path / "ref_hi_family_map.yaml").write_text(
-        "HI-1001: AIR_MANAGEMENT\n",
+        "HI-1001: AIR_MANAGEMENT\nHI-3002: COOLING_SYSTEM\n",
         encoding="utf-8",
     )
     (tmp_path / "ref_confidence_map.yaml").write_text(
@@ -23,5 +25,84 @@ def test_reference_loader_merges_catalog_and_family(tmp_path: Path):
     assert "HI-1001" in merged
     assert merged["HI-1001"]["description"] == "Turbo variance"
     assert merged["HI-1001"]["family"] == "AIR_MANAGEMENT"
+    assert merged["HI-3002"] == {
+        "description": "No description available",
+        "family": "COOLING_SYSTEM",
+    }
     assert loader.confidence_label(0.8) == "high confidence"
 
+
+def test_reference_loader_prefers_fresh_json_sidecar(tmp_path: Path):
+    for name in ("ref_hi_catalog", "ref_hi_family_map", "ref_confidence_map"):
+        (tmp_path / f"{name}.yaml").write_text("{}\n", encoding="utf-8")
+    (tmp_path / "ref_hi_catalog.json").write_text(
+        '{"HI-2002": {"description": "Injector drift"}}',
+        encoding="utf-8",
+    )
+
+    merged = ReferenceLoader(reference_dir=tmp_path).load_reference_map()
+
+    assert merged["HI-2002"]["description"] == "Injector drift"
+
+
+def test_reference_bundle_is_shared_and_read_only(tmp_path: Path):
+    for name in ("ref_hi_catalog", "ref_hi_family_map", "ref_confidence_map"):
+        (tmp_path / f"{name}.yaml").write_text("{}\n", encoding="utf-8")
+
+    first = ReferenceLoader(reference_dir=tmp_path).load_bundle()
+    second = ReferenceLoader(reference_dir=tmp_path).load_bundle()
+
+    assert first is second
+    with pytest.raises(TypeError):
+        first["hi_catalog"]["HI-9999"] = {}
+
+
+def test_reference_bundle_reloads_when_file_changes(tmp_path: Path):
+    for name in ("ref_hi_family_map", "ref_confidence_map"):
+        (tmp_path / f"{name}.yaml").write_text("{}\n", encoding="utf-8")
+    catalog = tmp_path / "ref_hi_catalog.yaml"
+    catalog.write_text("HI-1001: Turbo variance\n", encoding="utf-8")
+
+    loader = ReferenceLoader(reference_dir=tmp_path)
+    first = loader.load_bundle()
+    assert loader.load_bundle() is first
+
+    catalog.write_text("HI-1001: Turbo variance (revised)\n", encoding="utf-8")
+
+    assert loader.load_reference_map()["HI-1001"]["description"] == "Turbo variance (revised)"
+
+
+@pytest.mark.parametrize(
+    ("ranges", "expected"),
+    [
+        (
+            "  - {min: 0.70, max: 1.00, label: high}\n"
+            "  - {min: 0.00, max: 0.39, label: low}\n",
+            {0.0: "low", 0.39: "low", 0.5: "unmapped confidence", 0.7: "high", 1.0: "high"},
+        ),
+        (
+            "  - {min: 0.00, max: 0.80, label: first}\n"
+            "  - {min: 0.50, max: 1.00, label: second}\n",
+            {0.6: "first", 0.9: "second", 1.5: "unmapped confidence"},
+        ),
+    ],
+)
+def test_confidence_label_matches_ranges(tmp_path: Path, ranges, expected):
+    for name in ("ref_hi_catalog", "ref_hi_family_map"):
+        (tmp_path / f"{name}.yaml").write_text("{}\n", encoding="utf-8")
+    (tmp_path / "ref_confidence_map.yaml").write_text(
+        "ranges:\n" + ranges,
+        encoding="utf-8",
+    )
+
+    loader = ReferenceLoader(reference_dir=tmp_path)
+
+    assert {score: loader.confidence_label(score) for score in expected} == expected
+
+
+def test_reference_loader_reports_missing_file(tmp_path: Path):
+    for name in ("ref_hi_catalog", "ref_confidence_map"):
+        (tmp_path / f"{name}.yaml").write_text("{}\n", encoding="utf-8")
+
+    with pytest.raises(ReferenceLoaderError, match="ref_hi_family_map.yaml"):
+        ReferenceLoader(reference_dir=tmp_path).load_bundle()
@@ -5,13 +5,16 @@ These tests validate deterministic VIN-level interpretation behavior
 using controlled, synthetic inputs.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
 from app.agents.vin_explainer_agent import VinExplainerAgent
 from app.models.vin import EvidenceItem, VinInterpretation
 
+# Fixed observation time keeps interpretation inputs identical across runs.
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 @pytest.fixture
 def reference_map():
@@ -22,15 +25,14 @@ def reference_map():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_signals():
-    now = datetime.utcnow()
     return {
         "mh": [
             {
                 "hi_code": "HI-4302",
                 "confidence": 0.9,
-                "observed_at": now,
+                "observed_at": NOW,
             }
         ],
         "mp": [],
@@ -38,38 +40,49 @@ def sample_signals():
     }
 
 
-def test_vin_interpretation_high_risk(reference_map, sample_signals):
-    agent = VinExplainerAgent(model_version="test")
+@pytest.fixture(scope="session")
+def agent():
+    # The agent holds no per-test state, so one instance serves the session.
+    return VinExplainerAgent(model_version="test")
+
+
+@pytest.mark.parametrize(
+    ("vin", "signals_key", "expected_vin", "expected_risk", "expected_recommendations"),
+    [
+        ("wvwzzz1kz6w000001", "mh", "WVWZZZ1KZ6W000001", {"ELEVATED", "HIGH"}, 1),
+        ("TESTVIN000", None, "TESTVIN000", {"LOW"}, 0),
+    ],
+    ids=["high_risk", "low_risk"],
+)
+def test_vin_interpretation_risk(
+    agent,
+    reference_map,
+    sample_signals,
+    vin,
+    signals_key,
+    expected_vin,
+    expected_risk,
+    expected_recommendations,
+):
+    signals = {
+        key: rows if key == signals_key else []
+        for key, rows in sample_signals.items()
+    }
 
     result = agent.explain(
-        vin="wvwzzz1kz6w000001",
-        mh_signals=sample_signals["mh"],
-        mp_signals=sample_signals["mp"],
-        fim_signals=sample_signals["fim"],
+        vin=vin,
+        mh_signals=signals["mh"],
+        mp_signals=signals["mp"],
+        fim_signals=signals["fim"],
         reference_map=reference_map,
     )
 
     assert isinstance(result, VinInterpretation)
-    assert result.vin == "WVWZZZ1KZ6W000001"
-    assert result.risk_level in {"ELEVATED", "HIGH"}
-    assert len(result.recommendations) == 1
-
-    rec = result.recommendations[0]
-    assert rec.urgency in {"MEDIUM", "HIGH"}
-    assert rec.evidence
-    assert isinstance(rec.evidence[0], EvidenceItem)
-
-
-def test_vin_interpretation_low_risk(reference_map):
-    agent = VinExplainerAgent(model_version="test")
-
-    result = agent.explain(
-        vin="TESTVIN000",
-        mh_signals=[],
-        mp_signals=[],
-        fim_signals=[],
-        reference_map=reference_map,
-    )
-
-    assert result.risk_level == "LOW"
-    assert result.recommendations == []
+    assert result.vin == expected_vin
+    assert result.risk_level in expected_risk
+    assert len(result.recommendations) == expected_recommendations
+
+    for rec in result.recommendations:
+        assert rec.urgency in {"MEDIUM", "HIGH"}
+        assert rec.evidence
+        assert isinstance(rec.evidence[0], EvidenceItem)
@@ -5,7 +5,7 @@ Only stable, shared utilities are exported here.
 Internal helpers should remain module-private.
 """
 
-from app.utils.config import load_config
+from app.utils.config import load_config, reload_config, reset_config
 from app.utils.logger import (
     get_logger,
     log_event,
@@ -13,14 +13,17 @@ from app.utils.logger import (
     set_vin,
     set_agent,
 )
-from app.utils.databricks_conn import DatabricksClient
+from app.utils.databricks_conn import close_databricks_client, get_databricks_client
 
 __all__ = [
     "load_config",
+    "reload_config",
+    "reset_config",
     "get_logger",
     "log_event",
     "set_request_id",
     "set_vin",
     "set_agent",
-    "DatabricksClient",
+    "get_databricks_client",
+    "close_databricks_client",
 ]
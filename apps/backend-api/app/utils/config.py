@@ -10,8 +10,8 @@ Key goals:
 from __future__ import annotations
 
 import os
-from functools import lru_cache
-from typing import Literal, Optional
+import threading
+from typing import Callable, List, Literal, Mapping, Optional
 
 from pydantic import BaseModel, Field, SecretStr, ValidationError
 
@@ -21,18 +21,27 @@ DataSource = Literal["databricks", "sample"]
 LLMProvider = Literal["openai", "openai_compatible", "none"]
 
 
-def _get_env(name: str, default: Optional[str] = None) -> str:
-    value = os.getenv(name, default)
+_TRUTHY = frozenset(("1", "true", "yes", "on", "y", "t"))
+
+
+def _get_env(
+    env_map: Mapping[str, str],
+    name: str,
+    default: Optional[str] = None,
+) -> str:
+    value = env_map.get(name, default)
     if value is None:
         raise RuntimeError(f"Missing required environment variable: {name}")
     return value
 
 
-def _env_bool(name: str, default: bool) -> bool:
-    raw = os.getenv(name)
+def _env_bool(env_map: Mapping[str, str], name: str, default: bool) -> bool:
+    raw = env_map.get(name)
     if raw is None:
         return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
+    # str.strip() hands back the same object when there is nothing to trim,
+    # so the common unpadded value costs no extra allocation.
+    return raw.strip().lower() in _TRUTHY
 
 
 class DatabricksConfig(BaseModel):
@@ -48,6 +57,7 @@ class DatabricksConfig(BaseModel):
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
         allow_population_by_field_name = True
 
 
@@ -63,6 +73,7 @@ class OpenAIConfig(BaseModel):
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
 
 
 class LLMConfig(BaseModel):
@@ -71,6 +82,7 @@ class LLMConfig(BaseModel):
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
 
 
 class DataConfig(BaseModel):
@@ -86,9 +98,25 @@ class DataConfig(BaseModel):
     mart_fim_table: str = Field(default="mart_fim_rootcause_daily")
     mart_cohort_metrics_table: str = Field(default="mart_cohort_metrics_daily")
     mart_cohort_anomalies_table: str = Field(default="mart_cohort_anomalies_daily")
+    mart_query_limit: int = Field(
+        default=500,
+        gt=0,
+        description="Maximum rows returned per mart query",
+    )
+    mart_cache_ttl_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="In-process TTL for VIN mart results (0 disables caching)",
+    )
+    mart_cache_size: int = Field(
+        default=1024,
+        gt=0,
+        description="Maximum cached VIN mart results",
+    )
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
 
 
 class EmailConfig(BaseModel):
@@ -101,6 +129,7 @@ class EmailConfig(BaseModel):
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
 
 
 class FeatureFlags(BaseModel):
@@ -113,6 +142,7 @@ class FeatureFlags(BaseModel):
 
     class Config:
         frozen = True
+        copy_on_model_validation = "none"
 
 
 class AppConfig(BaseModel):
@@ -130,7 +160,10 @@ class AppConfig(BaseModel):
         frozen = True
 
 
-def _load_optional_databricks(source: DataSource) -> Optional[DatabricksConfig]:
+def _load_optional_databricks(
+    env_map: Mapping[str, str],
+    source: DataSource,
+) -> Optional[DatabricksConfig]:
     required = [
         "DATABRICKS_HOST",
         "DATABRICKS_HTTP_PATH",
@@ -139,33 +172,37 @@ def _load_optional_databricks(source: DataSource) -> Optional[DatabricksConfig]:
         "DATABRICKS_SCHEMA",
     ]
 
-    available = [k for k in required if os.getenv(k)]
+    values = {key: env_map.get(key) for key in required}
+    missing = [key for key, value in values.items() if not value]
 
-    if source == "databricks" and len(available) < len(required):
-        missing = [k for k in required if not os.getenv(k)]
+    if source == "databricks" and missing:
         raise RuntimeError(
             "DATA_SOURCE=databricks requires Databricks settings: "
             + ", ".join(missing)
         )
 
-    if not available:
+    if len(missing) == len(required):
         return None
 
+    for key in missing:
+        if values[key] is None:
+            raise RuntimeError(f"Missing required environment variable: {key}")
+
     return DatabricksConfig(
-        host=_get_env("DATABRICKS_HOST"),
-        http_path=_get_env("DATABRICKS_HTTP_PATH"),
-        token=SecretStr(_get_env("DATABRICKS_TOKEN")),
-        catalog=_get_env("DATABRICKS_CATALOG"),
-        schema_name=_get_env("DATABRICKS_SCHEMA"),
+        host=values["DATABRICKS_HOST"],
+        http_path=values["DATABRICKS_HTTP_PATH"],
+        token=SecretStr(values["DATABRICKS_TOKEN"]),
+        catalog=values["DATABRICKS_CATALOG"],
+        schema_name=values["DATABRICKS_SCHEMA"],
     )
 
 
-def _load_llm() -> LLMConfig:
-    provider_raw = (os.getenv("LLM_PROVIDER") or "").strip().lower()
-    llm_api_key = os.getenv("LLM_API_KEY")
-    openai_api_key = os.getenv("OPENAI_API_KEY")
+def _load_llm(env_map: Mapping[str, str]) -> LLMConfig:
+    provider_raw = (env_map.get("LLM_PROVIDER") or "").strip().lower()
+    llm_api_key = env_map.get("LLM_API_KEY")
+    openai_api_key = env_map.get("OPENAI_API_KEY")
     api_key = llm_api_key or openai_api_key
-    base_url = os.getenv("LLM_BASE_URL")
+    base_url = env_map.get("LLM_BASE_URL")
 
     if provider_raw and provider_raw not in {"openai", "openai_compatible", "none"}:
         raise RuntimeError(
@@ -191,68 +228,132 @@ def _load_llm() -> LLMConfig:
 
     openai_cfg = OpenAIConfig(
         api_key=SecretStr(api_key),
-        model=os.getenv("LLM_MODEL", os.getenv("OPENAI_MODEL", "gpt-4.1-mini")),
+        model=env_map.get("LLM_MODEL", env_map.get("OPENAI_MODEL", "gpt-4.1-mini")),
         temperature=float(
-            os.getenv("LLM_TEMPERATURE", os.getenv("OPENAI_TEMPERATURE", "0.2"))
+            env_map.get("LLM_TEMPERATURE", env_map.get("OPENAI_TEMPERATURE", "0.2"))
         ),
         max_tokens=int(
-            os.getenv("LLM_MAX_TOKENS", os.getenv("OPENAI_MAX_TOKENS", "1024"))
+            env_map.get("LLM_MAX_TOKENS", env_map.get("OPENAI_MAX_TOKENS", "1024"))
         ),
         base_url=base_url,
     )
     return LLMConfig(provider=provider, openai=openai_cfg)
 
 
-@lru_cache(maxsize=1)
+_config: Optional[AppConfig] = None
+_config_lock = threading.Lock()
+# Called with the new configuration after every successful reload_config().
+_reload_hooks: List[Callable[[AppConfig], None]] = []
+
+
 def load_config() -> AppConfig:
+    """
+    Return the process-wide configuration, loading it on first use.
+
+    A failed load is not cached, so the next call retries.
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = _build_config()
+    return _config
+
+
+def reset_config() -> None:
+    """
+    Drop the loaded configuration so the next load_config() re-reads the
+    environment. Intended for tests.
+    """
+    global _config
+    with _config_lock:
+        _config = None
+
+
+def reload_config() -> AppConfig:
+    """
+    Re-read and revalidate the environment, replacing the loaded configuration.
+
+    The swap happens under the load lock, so concurrent readers see either
+    the old or the new configuration, never a partially built one. If the
+    new environment is invalid the previous configuration stays in place.
+    Registered reload hooks run after the swap, outside the lock, so they
+    can drop state derived from the old configuration.
+    """
+    global _config
+    with _config_lock:
+        _config = config = _build_config()
+    for hook in list(_reload_hooks):
+        hook(config)
+    return config
+
+
+def register_reload_hook(hook: Callable[[AppConfig], None]) -> None:
+    """
+    Run `hook(new_config)` after every successful reload_config().
+    """
+    if hook not in _reload_hooks:
+        _reload_hooks.append(hook)
+
+
+def _build_config() -> AppConfig:
     """
     Load and validate runtime configuration.
+
+    The environment is snapshotted once, so every setting is read from the
+    same view even if the process environment changes mid-load.
     """
 
+    env_map = dict(os.environ)
+
     try:
-        env: Environment = _get_env("APP_ENV", "local")  # type: ignore
-        data_source: DataSource = _get_env("DATA_SOURCE", "sample")  # type: ignore
+        env: Environment = _get_env(env_map, "APP_ENV", "local")  # type: ignore
+        data_source: DataSource = _get_env(env_map, "DATA_SOURCE", "sample")  # type: ignore
 
         data = DataConfig(
             source=data_source,
-            reference_dir=os.getenv("REFERENCE_DIR", "data/reference"),
-            sample_file=os.getenv("SAMPLE_DATA_FILE", "data/sample/sample_vin_data.json"),
-            mart_mh_table=os.getenv("MART_MH_TABLE", "mart_mh_hi_snapshot_daily"),
-            mart_mp_table=os.getenv("MART_MP_TABLE", "mart_mp_triggers_daily"),
-            mart_fim_table=os.getenv("MART_FIM_TABLE", "mart_fim_rootcause_daily"),
-            mart_cohort_metrics_table=os.getenv(
+            reference_dir=env_map.get("REFERENCE_DIR", "data/reference"),
+            sample_file=env_map.get("SAMPLE_DATA_FILE", "data/sample/sample_vin_data.json"),
+            mart_mh_table=env_map.get("MART_MH_TABLE", "mart_mh_hi_snapshot_daily"),
+            mart_mp_table=env_map.get("MART_MP_TABLE", "mart_mp_triggers_daily"),
+            mart_fim_table=env_map.get("MART_FIM_TABLE", "mart_fim_rootcause_daily"),
+            mart_cohort_metrics_table=env_map.get(
                 "MART_COHORT_METRICS_TABLE",
                 "mart_cohort_metrics_daily",
             ),
-            mart_cohort_anomalies_table=os.getenv(
+            mart_cohort_anomalies_table=env_map.get(
                 "MART_COHORT_ANOMALIES_TABLE",
                 "mart_cohort_anomalies_daily",
             ),
+            mart_query_limit=int(env_map.get("MART_QUERY_LIMIT", "500")),
+            mart_cache_ttl_seconds=float(env_map.get("MART_CACHE_TTL_SECONDS", "300")),
+            mart_cache_size=int(env_map.get("MART_CACHE_SIZE", "1024")),
         )
 
-        databricks = _load_optional_databricks(data_source)
-        llm = _load_llm()
+        databricks = _load_optional_databricks(env_map, data_source)
+        llm = _load_llm(env_map)
 
         email = EmailConfig(
-            enabled=_env_bool("EMAIL_ENABLED", False),
-            smtp_host=os.getenv("SMTP_HOST"),
-            smtp_port=int(os.getenv("SMTP_PORT", "0")) or None,
-            username=os.getenv("SMTP_USERNAME"),
-            password=SecretStr(os.getenv("SMTP_PASSWORD"))
-            if os.getenv("SMTP_PASSWORD")
+            enabled=_env_bool(env_map, "EMAIL_ENABLED", False),
+            smtp_host=env_map.get("SMTP_HOST"),
+            smtp_port=int(env_map.get("SMTP_PORT", "0")) or None,
+            username=env_map.get("SMTP_USERNAME"),
+            password=SecretStr(env_map.get("SMTP_PASSWORD"))
+            if env_map.get("SMTP_PASSWORD")
             else None,
-            from_address=os.getenv("EMAIL_FROM"),
+            from_address=env_map.get("EMAIL_FROM"),
         )
 
         features = FeatureFlags(
-            enable_genai=_env_bool("FEATURE_GENAI", True),
-            enable_langgraph=_env_bool("FEATURE_LANGGRAPH", True),
+            enable_genai=_env_bool(env_map, "FEATURE_GENAI", True),
+            enable_langgraph=_env_bool(env_map, "FEATURE_LANGGRAPH", True),
             allow_deterministic_fallback=_env_bool(
+                env_map,
                 "FEATURE_ALLOW_DETERMINISTIC_FALLBACK",
                 False,
             ),
-            enable_pdf_export=_env_bool("FEATURE_PDF", True),
-            enable_email_delivery=_env_bool("FEATURE_EMAIL", False),
+            enable_pdf_export=_env_bool(env_map, "FEATURE_PDF", True),
+            enable_email_delivery=_env_bool(env_map, "FEATURE_EMAIL", False),
             strict_validation=env == "prod",
         )
 
@@ -264,7 +365,7 @@ def load_config() -> AppConfig:
 
         return AppConfig(
             env=env,
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            log_level=env_map.get("LOG_LEVEL", "INFO"),
             data=data,
             databricks=databricks,
             llm=llm,
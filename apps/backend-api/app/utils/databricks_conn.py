@@ -10,27 +10,78 @@ Principles:
 
 from __future__ import annotations
 
+import logging
+import queue
+import re
+import sys
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Generator, Optional, Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence, Tuple
 
 from app.utils.config import load_config
 from app.utils.logger import get_logger, log_event
 
 logger = get_logger(__name__)
 
+# Idle connections kept per query tag. Session configuration (QUERY_TAGS) is
+# fixed at connect time, so connections are only reused within a tag.
+_POOL_SIZE = 8
+
+# The `open` flag is local state and stays True after the warehouse expires
+# an idle session, and a stale connection would only fail inside the
+# caller's query (which is never retried). Connections idle longer than this
+# are closed at checkout instead of being reused.
+_POOL_MAX_IDLE_SECONDS = 300.0
+
+_DEFAULT_QUERY_TAG = "genai-predictive-platform"
+
+# The connector copies session_configuration before use, so untagged
+# connections can share one read-only mapping.
+_DEFAULT_SESSION_CFG = MappingProxyType({
+    "QUERY_TAGS": _DEFAULT_QUERY_TAG,
+    "ANSI_MODE": "true",
+})
+
+# Anchored, case-insensitive prefix check: only the leading characters are
+# scanned, so large generated queries are never copied or lowercased.
+_SELECT_RE = re.compile(r"\s*select\b", re.IGNORECASE)
+
 
 class DatabricksConnectionError(RuntimeError):
     pass
 
 
+# databricks-sql-connector is optional; it is resolved on first connect and
+# held here so later connections skip the import machinery entirely.
+_sql: Any = None
+
+
+def _get_sql() -> Any:
+    global _sql
+    if _sql is None:
+        try:
+            from databricks import sql
+        except Exception as exc:
+            raise DatabricksConnectionError(
+                "databricks-sql-connector is not installed"
+            ) from exc
+        _sql = sql
+    return _sql
+
+
 class DatabricksClient:
     """
     Thin, safe wrapper around Databricks SQL connector.
     """
 
+    __slots__ = ("_config", "_pools", "_pools_lock")
+
     def __init__(self) -> None:
         self._config = None
+        self._pools: Dict[str, "queue.LifoQueue[Any]"] = {}
+        self._pools_lock = threading.Lock()
 
     def _get_config(self):
         if self._config is None:
@@ -54,48 +105,118 @@ class DatabricksClient:
         """
         Context-managed Databricks SQL connection.
         Enforces retry, tagging, and clean teardown.
+
+        Connections are pooled per query tag: a clean exit returns the
+        connection for reuse, while an exception closes it.
         """
 
-        config = self._get_config()
+        tag = query_tag or _DEFAULT_QUERY_TAG
+        pool = self._pool(tag)
+
+        conn = self._checkout(pool)
+        if conn is None:
+            conn = self._open_connection(
+                tag,
+                retries=retries,
+                retry_backoff=retry_backoff,
+            )
 
+        # Errors raised by the caller propagate as-is rather than being
+        # mistaken for connection failures and retried.
         try:
-            from databricks import sql
-        except Exception as exc:
-            raise DatabricksConnectionError(
-                "databricks-sql-connector is not installed"
-            ) from exc
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+
+        try:
+            pool.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            conn.close()
 
-        attempt = 0
+    def close(self) -> None:
+        """
+        Close every idle pooled connection.
+        """
+
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            while True:
+                try:
+                    conn, _ = pool.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+
+    def _pool(self, tag: str) -> "queue.LifoQueue[Tuple[Any, float]]":
+        pool = self._pools.get(tag)
+        if pool is None:
+            with self._pools_lock:
+                pool = self._pools.setdefault(tag, queue.LifoQueue(maxsize=_POOL_SIZE))
+        return pool
+
+    @staticmethod
+    def _checkout(pool: "queue.LifoQueue[Tuple[Any, float]]") -> Any:
+        # LIFO hands back the most recently used connection, which is the one
+        # least likely to have been dropped server-side while idle.
         while True:
+            try:
+                conn, idle_since = pool.get_nowait()
+            except queue.Empty:
+                return None
+            if (
+                getattr(conn, "open", True)
+                and time.monotonic() - idle_since <= _POOL_MAX_IDLE_SECONDS
+            ):
+                return conn
+            conn.close()
+
+    def _open_connection(
+        self,
+        tag: str,
+        *,
+        retries: int,
+        retry_backoff: float,
+    ) -> Any:
+        config = self._get_config()
+        sql = _get_sql()
+
+        if tag == _DEFAULT_QUERY_TAG:
+            session_configuration = _DEFAULT_SESSION_CFG
+        else:
+            session_configuration = {"QUERY_TAGS": tag, "ANSI_MODE": "true"}
+
+        # One delay between each pair of attempts; the last attempt gets None
+        # so a final failure raises without sleeping first.
+        delays = [retry_backoff ** step for step in range(1, retries)]
+
+        for delay in (*delays, None):
             try:
                 conn = sql.connect(
                     server_hostname=config.host,
                     http_path=config.http_path,
                     access_token=config.token.get_secret_value(),
-                    session_configuration={
-                        "QUERY_TAGS": query_tag or "genai-predictive-platform",
-                        "ANSI_MODE": "true",
-                    },
-                )
-
-                log_event(
-                    logger,
-                    "Databricks connection established",
-                    extra={"query_tag": query_tag},
+                    session_configuration=session_configuration,
                 )
-
-                yield conn
-                conn.close()
-                return
+                break
 
             except Exception as exc:
-                attempt += 1
-                if attempt >= retries:
+                if delay is None:
                     raise DatabricksConnectionError(
                         "Failed to connect to Databricks SQL Warehouse"
                     ) from exc
 
-                time.sleep(retry_backoff ** attempt)
+                time.sleep(delay)
+
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "Databricks connection established",
+                extra={"query_tag": tag},
+            )
+
+        return conn
 
     def execute_query(
         self,
@@ -103,30 +224,167 @@ class DatabricksClient:
         *,
         query_tag: Optional[str] = None,
         query_params: Optional[Sequence[Any]] = None,
-    ):
+        batch_size: int = 10_000,
+        lowercase_columns: bool = False,
+    ) -> Iterator[Tuple[List[str], List[Any]]]:
         """
-        Execute a read-only SQL query and return all rows.
+        Execute a read-only SQL query and yield `(columns, rows)` batches.
+
+        Rows are fetched `batch_size` at a time, so peak memory is bounded by
+        one batch and callers can start on the first batch while the rest of
+        the result set is still in flight. An empty result yields a single
+        `(columns, [])` batch so column metadata is not lost. The connection
+        stays open until the iterator is exhausted. `lowercase_columns`
+        normalizes column names once per query.
         """
 
-        if not query.strip().lower().startswith("select"):
-            raise ValueError("Only SELECT queries are allowed")
+        self._ensure_read_only(query)
 
+        row_count = 0
         with self.connect(query_tag=query_tag) as conn:
             with conn.cursor() as cursor:
                 if query_params is None:
                     cursor.execute(query)
                 else:
                     cursor.execute(query, query_params)
-                columns = [col[0] for col in cursor.description]
-                rows = cursor.fetchall()
-
-        log_event(
-            logger,
-            "Databricks query executed",
-            extra={
-                "row_count": len(rows),
-                "query_tag": query_tag,
-            },
-        )
+                # Interned names make every row dict share one key object per
+                # column, and lookups against literal keys compare by identity.
+                columns = [
+                    sys.intern(col[0].lower() if lowercase_columns else col[0])
+                    for col in cursor.description
+                ]
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        if not row_count:
+                            yield columns, []
+                        break
+                    row_count += len(rows)
+                    yield columns, rows
+
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "Databricks query executed",
+                extra={
+                    "row_count": row_count,
+                    "query_tag": query_tag,
+                    "format": "batches",
+                },
+            )
 
+    def execute_query_all(
+        self,
+        query: str,
+        *,
+        query_tag: Optional[str] = None,
+        query_params: Optional[Sequence[Any]] = None,
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Execute a read-only SQL query and return `(columns, rows)` in full.
+        """
+
+        columns: List[str] = []
+        rows: List[Any] = []
+        for columns, batch in self.execute_query(
+            query,
+            query_tag=query_tag,
+            query_params=query_params,
+        ):
+            rows.extend(batch)
         return columns, rows
+
+    def stream_query(
+        self,
+        query: str,
+        *,
+        query_tag: Optional[str] = None,
+        query_params: Optional[Sequence[Any]] = None,
+        batch_size: int = 1000,
+        lowercase_columns: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a read-only SQL query and yield rows as dicts.
+
+        Built on `execute_query`, so rows arrive `batch_size` at a time and
+        the result set is never held in memory as a whole.
+        """
+
+        for columns, rows in self.execute_query(
+            query,
+            query_tag=query_tag,
+            query_params=query_params,
+            batch_size=batch_size,
+            lowercase_columns=lowercase_columns,
+        ):
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    def execute_query_arrow(
+        self,
+        query: str,
+        *,
+        query_tag: Optional[str] = None,
+        query_params: Optional[Sequence[Any]] = None,
+    ):
+        """
+        Execute a read-only SQL query and return the result as a pyarrow Table.
+
+        The connector streams Arrow batches natively, so no per-row Python
+        objects are created here.
+        """
+
+        self._ensure_read_only(query)
+
+        with self.connect(query_tag=query_tag) as conn:
+            with conn.cursor() as cursor:
+                if query_params is None:
+                    cursor.execute(query)
+                else:
+                    cursor.execute(query, query_params)
+                table = cursor.fetchall_arrow()
+
+        if logger.isEnabledFor(logging.INFO):
+            log_event(
+                logger,
+                "Databricks query executed",
+                extra={
+                    "row_count": table.num_rows,
+                    "query_tag": query_tag,
+                    "format": "arrow",
+                },
+            )
+
+        return table
+
+    @staticmethod
+    def _ensure_read_only(query: str) -> None:
+        if not _SELECT_RE.match(query):
+            raise ValueError("Only SELECT queries are allowed")
+
+
+_client: Optional[DatabricksClient] = None
+_client_lock = threading.Lock()
+
+
+def get_databricks_client() -> DatabricksClient:
+    """
+    Return the process-wide Databricks client, creating it on first use.
+
+    Configuration is resolved lazily on first connect, so obtaining the
+    client is cheap even where Databricks is not configured.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DatabricksClient()
+    return _client
+
+
+def close_databricks_client() -> None:
+    """
+    Close the process-wide client's pooled connections, if it was created.
+    """
+    if _client is not None:
+        _client.close()
@@ -11,63 +11,150 @@ Design goals:
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
 import os
+import queue
 import sys
+import threading
+import time
 import uuid
 from contextvars import ContextVar
-from datetime import datetime
-from typing import Any, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode("utf-8")
+
+except Exception:  # pragma: no cover - depends on optional runtime packages
+
+    def _json_dumps(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, default=str)
+
+
+# Strings are escaped exactly as orjson does (quotes, backslashes and control
+# characters; non-ASCII passes through as UTF-8).
+_json_str = json.encoder.encode_basestring
+
+
+def _json_value(value: Any) -> str:
+    return _json_str(value) if isinstance(value, str) else _json_dumps(value)
 
-from app.utils.config import load_config
 
 # ---------------------------------------------------------------------
 # Context variables (request / trace scoped)
 # ---------------------------------------------------------------------
 
-request_id_ctx: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
-vin_ctx: ContextVar[Optional[str]] = ContextVar("vin", default=None)
-agent_ctx: ContextVar[Optional[str]] = ContextVar("agent", default=None)
+# One ContextVar holds every forensic field so a log record reads its context
+# with a single lookup. Values are replaced, never mutated in place, because
+# copied contexts (asyncio tasks, to_thread) share the mapping by reference.
+# Only fields with a value are stored.
+_EMPTY_CONTEXT: Mapping[str, str] = MappingProxyType({})
+_log_context: ContextVar[Mapping[str, str]] = ContextVar(
+    "log_context",
+    default=_EMPTY_CONTEXT,
+)
 
 
 # ---------------------------------------------------------------------
 # Helpers to set / get context
 # ---------------------------------------------------------------------
 
+def _set_context_field(key: str, value: Optional[str]) -> None:
+    current = _log_context.get()
+    if value:
+        if current.get(key) == value:
+            return
+        _log_context.set({**current, key: value})
+    elif key in current:
+        _log_context.set({k: v for k, v in current.items() if k != key})
+
+
 def set_request_id(request_id: Optional[str] = None) -> str:
     rid = request_id or str(uuid.uuid4())
-    request_id_ctx.set(rid)
+    _set_context_field("request_id", rid)
     return rid
 
 
 def set_vin(vin: Optional[str]) -> None:
-    vin_ctx.set(vin)
+    _set_context_field("vin", vin)
 
 
 def set_agent(agent_name: Optional[str]) -> None:
-    agent_ctx.set(agent_name)
+    _set_context_field("agent", agent_name)
 
 
-def _get_context() -> Dict[str, Optional[str]]:
-    return {
-        "request_id": request_id_ctx.get(),
-        "vin": vin_ctx.get(),
-        "agent": agent_ctx.get(),
-    }
+def _get_context() -> Mapping[str, str]:
+    return _log_context.get()
 
 
 # ---------------------------------------------------------------------
 # JSON Log Formatter
 # ---------------------------------------------------------------------
 
+_SITE_CACHE_SIZE = 4096
+
+
 class JsonLogFormatter(logging.Formatter):
     """
     Structured JSON formatter with forensic metadata.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted prefix); records arrive in bursts within
+        # the same second, so the strftime result is reused between them.
+        self._second_cache: Tuple[int, str] = (-1, "")
+        # Pre-encoded JSON around the message for each call site, used for
+        # records that carry no extras and no exception.
+        self._site_cache: Dict[Tuple[str, str, str, Optional[str], int], Tuple[str, str]] = {}
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int(record.msecs):03d}Z"
+
+    def _format_plain(self, record: logging.LogRecord) -> str:
+        key = (record.name, record.levelname, record.module, record.funcName, record.lineno)
+        site = self._site_cache.get(key)
+        if site is None:
+            if len(self._site_cache) >= _SITE_CACHE_SIZE:
+                self._site_cache.clear()
+            site = self._site_cache[key] = (
+                f',"level":{_json_value(record.levelname)}'
+                f',"logger":{_json_value(record.name)},"message":',
+                f',"module":{_json_value(record.module)}'
+                f',"function":{_json_value(record.funcName)}'
+                f',"line":{_json_value(record.lineno)}',
+            )
+        head, tail = site
+
+        context = "".join(
+            f",{_json_str(k)}:{_json_value(v)}" for k, v in _get_context().items()
+        )
+        return (
+            f'{{"timestamp":"{self._timestamp(record)}"{head}'
+            f"{_json_str(record.getMessage())}{tail}{context}}}"
+        )
+
     def format(self, record: logging.LogRecord) -> str:
+        # Same keys, order and encoding as the dict path below; only the
+        # per-call-site fields are served from the cache.
+        if not record.exc_info and not getattr(record, "extra_fields", None):
+            return self._format_plain(record)
+
         base: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(timespec="milliseconds") + "Z",
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -77,7 +164,7 @@ class JsonLogFormatter(logging.Formatter):
         }
 
         # Attach forensic context
-        base.update({k: v for k, v in _get_context().items() if v})
+        base.update(_get_context())
 
         # Exception info (clean, stack preserved)
         if record.exc_info:
@@ -92,8 +179,7 @@ class JsonLogFormatter(logging.Formatter):
 
 def _to_json(payload: Dict[str, Any]) -> str:
     try:
-        import json
-        return json.dumps(payload, default=str)
+        return _json_dumps(payload)
     except Exception:
         # Absolute last-resort fallback
         return str(payload)
@@ -103,6 +189,52 @@ def _to_json(payload: Dict[str, Any]) -> str:
 # Logger Factory
 # ---------------------------------------------------------------------
 
+# Names configured by get_logger. logging.getLogger already interns loggers,
+# so this only records which ones have had the JSON handler attached.
+_configured_loggers: Set[str] = set()
+_configure_lock = threading.Lock()
+
+# Records are rendered to JSON on the calling thread (context variables are
+# only visible there) and handed to a background listener that owns the
+# blocking stdout write. The queue is drained only when the listener stops at
+# interpreter exit, so records still queued when the process is killed or
+# calls os._exit() are lost. LOG_SYNC=true writes on the calling thread
+# instead (tests rely on this so pytest captures each record with its test).
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_shared_handler: Optional[logging.Handler] = None
+_queue_listener: Optional[QueueListener] = None
+_SYNC_TRUTHY = frozenset(("1", "true", "yes", "on", "y", "t"))
+
+
+def _shared_log_handler() -> logging.Handler:
+    """
+    Return the process-wide log handler, starting the queue listener on
+    first use. Callers must hold _configure_lock.
+    """
+    global _shared_handler, _queue_listener
+    if _shared_handler is not None:
+        return _shared_handler
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if os.getenv("LOG_SYNC", "").strip().lower() in _SYNC_TRUTHY:
+        stream_handler.setFormatter(JsonLogFormatter())
+        _shared_handler = stream_handler
+        return _shared_handler
+
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _queue_listener = QueueListener(
+        _log_queue,
+        stream_handler,
+        respect_handler_level=True,
+    )
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
+    _shared_handler = QueueHandler(_log_queue)
+    _shared_handler.setFormatter(JsonLogFormatter())
+    return _shared_handler
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Create or retrieve a configured logger.
@@ -110,23 +242,21 @@ def get_logger(name: str) -> logging.Logger:
 
     logger = logging.getLogger(name)
 
-    if logger.handlers:
-        return logger  # already configured
+    if name in _configured_loggers:
+        return logger
 
-    # Keep logger usable even when full app config is unavailable
-    # (e.g., unit tests without Databricks/OpenAI env vars).
-    try:
-        log_level = load_config().log_level.upper()
-    except Exception:
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-
-    logger.setLevel(log_level)
-    logger.propagate = False
+    with _configure_lock:
+        if name in _configured_loggers:
+            return logger
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JsonLogFormatter())
+        # AppConfig.log_level is LOG_LEVEL verbatim, so reading it here gives
+        # the same level without building (or, when the environment is
+        # incomplete, repeatedly failing to build) the full config at import.
+        logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+        logger.propagate = False
 
-    logger.addHandler(handler)
+        logger.addHandler(_shared_log_handler())
+        _configured_loggers.add(name)
 
     return logger
 
@@ -135,16 +265,31 @@ def get_logger(name: str) -> logging.Logger:
 # Safe logging helpers (GenAI-aware)
 # ---------------------------------------------------------------------
 
+_BLOCKED_KEYS = frozenset({
+    "api_key",
+    "token",
+    "password",
+    "secret",
+    "authorization",
+    "prompt",
+    "raw_prompt",
+})
+_REDACTED = "***REDACTED***"
+
+
 def log_event(
     logger: logging.Logger,
     message: str,
-    *,
+    *args: Any,
     level: int = logging.INFO,
     extra: Optional[Dict[str, Any]] = None,
 ) -> None:
     """
     Log a structured event with safe extra fields.
 
+    Dynamic messages should use %-style placeholders with ``args`` rather
+    than f-strings, so filtered events are never formatted.
+
     Never log:
     - raw prompts
     - secrets
@@ -152,11 +297,16 @@ def log_event(
     - credentials
     """
 
+    # Filtered events skip sanitization and record construction entirely.
+    if not logger.isEnabledFor(level):
+        return
+
     safe_extra = _sanitize(extra or {})
 
     logger.log(
         level,
         message,
+        *args,
         extra={"extra_fields": safe_extra},
     )
 
@@ -165,20 +315,10 @@ def _sanitize(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Best-effort sanitization to prevent sensitive leakage.
     """
-    blocked_keys = {
-        "api_key",
-        "token",
-        "password",
-        "secret",
-        "authorization",
-        "prompt",
-        "raw_prompt",
-    }
+    if not data:
+        return data
 
-    sanitized: Dict[str, Any] = {}
-    for k, v in data.items():
-        if k.lower() in blocked_keys:
-            sanitized[k] = "***REDACTED***"
-        else:
-            sanitized[k] = v
-    return sanitized
+    return {
+        k: _REDACTED if k.lower() in _BLOCKED_KEYS else v
+        for k, v in data.items()
+    }
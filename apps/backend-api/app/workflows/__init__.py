@@ -3,6 +3,7 @@ Workflow layer for graph-based orchestration.
 """
 
 from app.workflows.graph_runner import GraphRunner
+from app.workflows.narrative import NarrativeComposer, get_narrative_composer
 
-__all__ = ["GraphRunner"]
+__all__ = ["GraphRunner", "NarrativeComposer", "get_narrative_composer"]
 
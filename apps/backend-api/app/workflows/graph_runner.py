@@ -1,23 +1,112 @@
 """
 Graph-based orchestration layer.
 
-Uses LangGraph as the primary orchestration runtime.
+Uses LangGraph as the primary orchestration runtime for the cohort workflow.
+The VIN workflow is a strict linear chain and runs its nodes directly.
 Deterministic sequential fallback is only used when explicitly enabled.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from app.models.cohort import CohortInterpretation
 from app.models.vin import EvidenceItem, Recommendation, VinInterpretation
 from app.utils.config import load_config
 from app.utils.logger import get_logger, log_event
-from app.workflows.narrative import NarrativeComposer
+from app.workflows.narrative import get_narrative_composer
 
 logger = get_logger(__name__)
 
+_compiled_cohort_graph_cache: Optional[Any] = None
+_compiled_cohort_graph_lock = threading.Lock()
+
+# The VIN workflow has no branching or fan-out, so a graph scheduler would
+# only add per-node dispatch overhead. Each step fills in its fields of the
+# shared _VinState. Move it back onto a graph if conditional edges are ever
+# needed.
+_VIN_PIPELINE: Tuple[str, ...] = (
+    "_node_vin_build_evidence",
+    "_node_vin_summarize",
+    "_node_vin_recommend",
+    "_node_vin_consolidate",
+    "_node_vin_assemble",
+)
+
+
+@lru_cache(maxsize=1)
+def _langgraph_types() -> Optional[Tuple[Any, Any]]:
+    """
+    (StateGraph, END), or None when langgraph is missing. A failed import is
+    remembered, so runners created later do not retry it.
+    """
+    try:
+        from langgraph.graph import END, StateGraph
+    except Exception:
+        return None
+    return StateGraph, END
+
+
+def _runner_node(method_name: str) -> Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+    """
+    Graph node that dispatches to the named GraphRunner method of the runner
+    passed in the invocation config.
+
+    A StateGraph(dict) holds its state in a single root channel that each
+    node's return value replaces, so the method's partial update is merged
+    into the incoming state here.
+    """
+
+    def node(state: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
+        runner = config["configurable"]["runner"]
+        return {**state, **getattr(runner, method_name)(state)}
+
+    node.__name__ = method_name
+    return node
+
+
+def _compiled_cohort_graph(state_graph_cls: Any, end: Any) -> Any:
+    """
+    Compile the cohort graph once per process.
+    """
+    global _compiled_cohort_graph_cache
+    if _compiled_cohort_graph_cache is None:
+        with _compiled_cohort_graph_lock:
+            if _compiled_cohort_graph_cache is None:
+                cohort_graph = state_graph_cls(dict)
+                cohort_graph.add_node("build_models", _runner_node("_node_cohort_build_models"))
+                cohort_graph.add_node("summarize", _runner_node("_node_cohort_summarize"))
+                cohort_graph.add_node("assemble", _runner_node("_node_cohort_assemble"))
+                cohort_graph.set_entry_point("build_models")
+                cohort_graph.add_edge("build_models", "summarize")
+                cohort_graph.add_edge("summarize", "assemble")
+                cohort_graph.add_edge("assemble", end)
+
+                _compiled_cohort_graph_cache = cohort_graph.compile()
+    return _compiled_cohort_graph_cache
+
+
+@dataclass(slots=True)
+class _VinState:
+    """
+    Working state of one VIN workflow run; inputs first, then node outputs.
+    """
+
+    vin: str
+    mh_signals: List[Dict[str, Any]]
+    mp_signals: List[Dict[str, Any]]
+    fim_signals: List[Dict[str, Any]]
+    reference_map: Mapping[str, Mapping[str, Any]]
+    evidence: List[EvidenceItem] = field(default_factory=list)
+    risk_level: str = ""
+    summary: str = ""
+    recommendations: List[Recommendation] = field(default_factory=list)
+    evidence_summary: Optional[Dict[str, Dict[str, object]]] = None
+    interpretation: Optional[VinInterpretation] = None
+
 
 @dataclass(frozen=True)
 class WorkflowResult:
@@ -33,11 +122,13 @@ class GraphRunner:
         self._cohort_agent = cohort_agent
         self._evidence_agent = evidence_agent
         self._model_version = model_version
-        self._composer = NarrativeComposer()
+        self._composer = get_narrative_composer()
 
         self._langgraph_available = False
-        self._vin_graph = None
         self._cohort_graph = None
+        # Compiled graphs are shared process-wide; each invocation carries the
+        # runner whose agents and composer its nodes should use.
+        self._graph_config = {"configurable": {"runner": self}}
 
         if self._config.features.enable_langgraph:
             self._initialize_graphs()
@@ -55,6 +146,14 @@ class GraphRunner:
                 "LangGraph orchestration is required but unavailable."
             )
 
+        # Resolved once: without a graph the checks above guarantee that
+        # fallback is allowed, so per-call routing would only re-derive this.
+        self._run_cohort_state: Callable[[Dict[str, Any]], WorkflowResult] = (
+            self._run_cohort_graph
+            if self._cohort_graph is not None
+            else self._run_cohort_fallback
+        )
+
     @property
     def langgraph_enabled(self) -> bool:
         return self._langgraph_available
@@ -66,35 +165,23 @@ class GraphRunner:
         mh_signals: List[Dict[str, Any]],
         mp_signals: List[Dict[str, Any]],
         fim_signals: List[Dict[str, Any]],
-        reference_map: Dict[str, Dict[str, Any]],
+        reference_map: Mapping[str, Mapping[str, Any]],
     ) -> WorkflowResult:
-        initial_state = {
-            "vin": vin,
-            "mh_signals": mh_signals,
-            "mp_signals": mp_signals,
-            "fim_signals": fim_signals,
-            "reference_map": reference_map,
-        }
+        state = _VinState(
+            vin=vin,
+            mh_signals=mh_signals,
+            mp_signals=mp_signals,
+            fim_signals=fim_signals,
+            reference_map=reference_map,
+        )
 
-        if self._vin_graph is None:
-            if self._config.features.allow_deterministic_fallback:
-                return self._run_vin_fallback(initial_state)
-            raise RuntimeError("VIN graph is unavailable.")
+        for step in _VIN_PIPELINE:
+            getattr(self, step)(state)
 
-        try:
-            final_state = self._vin_graph.invoke(initial_state)
-            return WorkflowResult(
-                vin_interpretation=final_state.get("interpretation"),
-                evidence_summary=final_state.get("evidence_summary"),
-            )
-        except Exception:
-            if self._config.features.allow_deterministic_fallback:
-                log_event(
-                    logger,
-                    "LangGraph VIN workflow failed, using deterministic fallback",
-                )
-                return self._run_vin_fallback(initial_state)
-            raise
+        return WorkflowResult(
+            vin_interpretation=state.interpretation,
+            evidence_summary=state.evidence_summary,
+        )
 
     def run_cohort(
         self,
@@ -111,13 +198,14 @@ class GraphRunner:
             "anomalies_raw": anomalies,
         }
 
-        if self._cohort_graph is None:
-            if self._config.features.allow_deterministic_fallback:
-                return self._run_cohort_fallback(initial_state)
-            raise RuntimeError("Cohort graph is unavailable.")
+        return self._run_cohort_state(initial_state)
 
+    def _run_cohort_graph(self, initial_state: Dict[str, Any]) -> WorkflowResult:
         try:
-            final_state = self._cohort_graph.invoke(initial_state)
+            final_state = self._cohort_graph.invoke(
+                initial_state,
+                config=self._graph_config,
+            )
             return WorkflowResult(
                 cohort_interpretation=final_state.get("interpretation")
             )
@@ -148,10 +236,22 @@ class GraphRunner:
             context=context,
         )
 
+    def stream_chat_reply(
+        self,
+        *,
+        user_message: str,
+        context: Optional[Dict[str, Any]],
+        deterministic_reply: str = "",
+    ) -> Iterator[str]:
+        return self._composer.stream_chat_reply(
+            user_message=user_message,
+            context=context,
+            deterministic_reply=deterministic_reply,
+        )
+
     def _initialize_graphs(self) -> None:
-        try:
-            from langgraph.graph import END, StateGraph
-        except Exception as exc:
+        langgraph_types = _langgraph_types()
+        if langgraph_types is None:
             log_event(
                 logger,
                 "LangGraph package unavailable",
@@ -160,92 +260,65 @@ class GraphRunner:
                 return
             raise RuntimeError(
                 "langgraph package is required when deterministic fallback is disabled."
-            ) from exc
-
-        # VIN graph
-        vin_graph = StateGraph(dict)
-        vin_graph.add_node("build_evidence", self._node_vin_build_evidence)
-        vin_graph.add_node("summarize", self._node_vin_summarize)
-        vin_graph.add_node("recommend", self._node_vin_recommend)
-        vin_graph.add_node("consolidate", self._node_vin_consolidate)
-        vin_graph.add_node("assemble", self._node_vin_assemble)
-        vin_graph.set_entry_point("build_evidence")
-        vin_graph.add_edge("build_evidence", "summarize")
-        vin_graph.add_edge("summarize", "recommend")
-        vin_graph.add_edge("recommend", "consolidate")
-        vin_graph.add_edge("consolidate", "assemble")
-        vin_graph.add_edge("assemble", END)
-
-        # Cohort graph
-        cohort_graph = StateGraph(dict)
-        cohort_graph.add_node("build_models", self._node_cohort_build_models)
-        cohort_graph.add_node("summarize", self._node_cohort_summarize)
-        cohort_graph.add_node("assemble", self._node_cohort_assemble)
-        cohort_graph.set_entry_point("build_models")
-        cohort_graph.add_edge("build_models", "summarize")
-        cohort_graph.add_edge("summarize", "assemble")
-        cohort_graph.add_edge("assemble", END)
-
-        self._vin_graph = vin_graph.compile()
-        self._cohort_graph = cohort_graph.compile()
+            )
+
+        self._cohort_graph = _compiled_cohort_graph(*langgraph_types)
         self._langgraph_available = True
 
         log_event(
             logger,
             "LangGraph workflows initialized",
-            extra={"vin_graph": True, "cohort_graph": True},
+            extra={"cohort_graph": True},
         )
 
     # -------------------------- VIN Nodes --------------------------
 
-    def _node_vin_build_evidence(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        evidence = self._vin_agent._build_evidence(
-            state["mh_signals"],
-            state["mp_signals"],
-            state["fim_signals"],
-            state["reference_map"],
+    def _node_vin_build_evidence(self, state: _VinState) -> None:
+        state.evidence = self._vin_agent._build_evidence(
+            state.mh_signals,
+            state.mp_signals,
+            state.fim_signals,
+            state.reference_map,
         )
-        return {"evidence": evidence}
 
-    def _node_vin_summarize(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        summary, risk_level = self._vin_agent._generate_summary(state["evidence"])
+    def _node_vin_summarize(self, state: _VinState) -> None:
+        state.risk_level = self._vin_agent._compute_risk_level(state.evidence)
         evidence_rows = [
             {
                 "signal_code": ev.signal_code,
                 "confidence": ev.confidence,
             }
-            for ev in state["evidence"]
+            for ev in state.evidence
         ]
-        summary = self._composer.compose_vin_summary(
-            vin=state["vin"],
-            risk_level=risk_level,
+        state.summary = self._composer.compose_vin_summary(
+            vin=state.vin,
+            risk_level=state.risk_level,
             evidence=evidence_rows,
         )
-        return {"summary": summary, "risk_level": risk_level}
 
-    def _node_vin_recommend(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        recommendations = self._vin_agent._generate_recommendations(state["evidence"])
-        return {"recommendations": recommendations}
+    def _node_vin_recommend(self, state: _VinState) -> None:
+        state.recommendations = self._vin_agent._generate_recommendations(state.evidence)
 
-    def _node_vin_consolidate(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        evidence_summary = self._evidence_agent.consolidate(
-            evidence=state["evidence"]
+    def _node_vin_consolidate(self, state: _VinState) -> None:
+        state.evidence_summary = self._evidence_agent.consolidate(
+            evidence=state.evidence
         )
-        return {"evidence_summary": evidence_summary}
 
-    def _node_vin_assemble(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        interpretation = VinInterpretation(
-            vin=state["vin"],
-            summary=state["summary"],
-            risk_level=state["risk_level"],
-            recommendations=state["recommendations"],
+    def _node_vin_assemble(self, state: _VinState) -> None:
+        state.interpretation = VinInterpretation(
+            vin=state.vin,
+            summary=state.summary,
+            risk_level=state.risk_level,
+            recommendations=state.recommendations,
             model_version=self._model_version,
         )
-        return {"interpretation": interpretation}
 
     # ------------------------ Cohort Nodes -------------------------
 
     def _node_cohort_build_models(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        # The three builders are independent but are short, GIL-bound model
+        # construction over already-loaded rows; fanning them out to threads
+        # would cost more in scheduling than it could overlap.
         metrics = self._cohort_agent._build_metrics(state["metrics_raw"])
         anomalies = self._cohort_agent._build_anomalies(state["anomalies_raw"])
         distribution = self._cohort_agent._risk_distribution(state["metrics_raw"])
@@ -256,16 +329,11 @@ class GraphRunner:
         }
 
     def _node_cohort_summarize(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        summary = self._cohort_agent._generate_summary(
-            state["metrics"],
-            state["anomalies"],
-        )
-        high_count = len([a for a in state["anomalies"] if a.severity.upper() == "HIGH"])
         summary = self._composer.compose_cohort_summary(
             cohort_id=state["cohort_id"],
-            high_anomaly_count=high_count,
+            high_anomaly_count=self._cohort_agent._high_severity_count(state["anomalies"]),
             total_anomaly_count=len(state["anomalies"]),
-            top_metrics=[{"name": m.name, "value": m.value} for m in state["metrics"]],
+            top_metrics=[{"name": m.name, "value": m.value} for m in state["metrics"][:3]],
         )
         return {"summary": summary}
 
@@ -283,49 +351,15 @@ class GraphRunner:
 
     # --------------------- Fallback Orchestration ------------------
 
-    def _run_vin_fallback(self, state: Dict[str, Any]) -> WorkflowResult:
-        evidence: List[EvidenceItem] = self._vin_agent._build_evidence(
-            state["mh_signals"],
-            state["mp_signals"],
-            state["fim_signals"],
-            state["reference_map"],
-        )
-        summary, risk_level = self._vin_agent._generate_summary(evidence)
-        summary = self._composer.compose_vin_summary(
-            vin=state["vin"],
-            risk_level=risk_level,
-            evidence=[
-                {"signal_code": ev.signal_code, "confidence": ev.confidence}
-                for ev in evidence
-            ],
-        )
-        recommendations: List[Recommendation] = self._vin_agent._generate_recommendations(
-            evidence
-        )
-        evidence_summary = self._evidence_agent.consolidate(evidence=evidence)
-
-        interpretation = VinInterpretation(
-            vin=state["vin"],
-            summary=summary,
-            risk_level=risk_level,
-            recommendations=recommendations,
-            model_version=self._model_version,
-        )
-        return WorkflowResult(
-            vin_interpretation=interpretation,
-            evidence_summary=evidence_summary,
-        )
-
     def _run_cohort_fallback(self, state: Dict[str, Any]) -> WorkflowResult:
         metrics = self._cohort_agent._build_metrics(state["metrics_raw"])
         anomalies = self._cohort_agent._build_anomalies(state["anomalies_raw"])
         distribution = self._cohort_agent._risk_distribution(state["metrics_raw"])
-        summary = self._cohort_agent._generate_summary(metrics, anomalies)
         summary = self._composer.compose_cohort_summary(
             cohort_id=state["cohort_id"],
-            high_anomaly_count=len([a for a in anomalies if a.severity.upper() == "HIGH"]),
+            high_anomaly_count=self._cohort_agent._high_severity_count(anomalies),
             total_anomaly_count=len(anomalies),
-            top_metrics=[{"name": m.name, "value": m.value} for m in metrics],
+            top_metrics=[{"name": m.name, "value": m.value} for m in metrics[:3]],
         )
 
         interpretation = CohortInterpretation(
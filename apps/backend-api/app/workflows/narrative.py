@@ -4,15 +4,161 @@ LangChain-backed narrative helpers with deterministic fallback.
 
 from __future__ import annotations
 
+import heapq
 import inspect
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from app.utils.config import load_config
+from app.utils.config import LLMConfig, load_config
 from app.utils.logger import get_logger, log_event
 
 logger = get_logger(__name__)
 
+# Deterministic fallback text, keyed by risk level. Substituted values are
+# never parsed as format strings, so braces in IDs or signal codes are safe.
+_VIN_SUMMARY_TEMPLATES: Dict[str, str] = {
+    "HIGH": (
+        "VIN {vin} shows multiple high-confidence predictive anomalies. "
+        "Dominant signals: {top}."
+    ),
+    "ELEVATED": (
+        "VIN {vin} shows elevated predictive risk with active anomaly signals. "
+        "Dominant signals: {top}."
+    ),
+}
+_VIN_SUMMARY_DEFAULT = (
+    "VIN {vin} currently has no high-confidence anomaly cluster. "
+    "Observed signals: {top}."
+)
+
+_COHORT_SUMMARY_TEMPLATES: Dict[str, str] = {
+    "HIGH": (
+        "Cohort {cohort_id} has high-severity anomaly concentration requiring immediate triage. "
+        "Key metrics: {metrics}."
+    ),
+    "ELEVATED": (
+        "Cohort {cohort_id} has emerging anomaly patterns that should be monitored. "
+        "Key metrics: {metrics}."
+    ),
+    "LOW": (
+        "Cohort {cohort_id} remains stable with no significant anomaly concentration. "
+        "Key metrics: {metrics}."
+    ),
+}
+
+
+_RESPONSE_CACHE_SIZE = 1024
+# Stands in for the VIN in cached VIN summaries (see _invoke_cached).
+_VIN_SLOT = "\x00VIN\x00"
+# Anything VIN-shaped left in a templated reply (a reformatted or lowercased
+# copy of the VIN) would leak the first vehicle's VIN to the others.
+_VIN_LIKE_RE = re.compile(r"[A-HJ-NPR-Z0-9]{17}", re.IGNORECASE)
+
+# The system block never varies, and everything request-specific sits in the
+# trailing human block, so providers that cache by prompt prefix (OpenAI does
+# so automatically) can reuse the stable part across calls.
+_SYSTEM_PROMPT = (
+    "You are a predictive-maintenance explainer. "
+    "Use only provided evidence. Do not invent diagnostics."
+)
+_HUMAN_PROMPT = (
+    "Entity: {entity}\n"
+    "Risk: {risk}\n"
+    "Top signals:\n{signals}\n"
+    "Write 2 concise sentences for control-room operators."
+)
+
+
+@lru_cache(maxsize=1)
+def _langchain_prompt_types() -> Optional[Tuple[Any, Any]]:
+    """
+    (ChatPromptTemplate, StrOutputParser), or None when LangChain is missing.
+    A failed import is remembered too, so it is not retried per composer.
+    """
+    try:
+        from langchain.prompts import ChatPromptTemplate
+        from langchain_core.output_parsers import StrOutputParser
+    except Exception:
+        return None
+    return ChatPromptTemplate, StrOutputParser
+
+
+@lru_cache(maxsize=1)
+def _chat_openai_cls() -> Optional[Tuple[Any, Optional[str]]]:
+    """
+    (ChatOpenAI, keyword for a custom base URL), or None when
+    langchain-openai is missing. The keyword was renamed across releases, so
+    it is probed here, once.
+    """
+    try:
+        from langchain_openai import ChatOpenAI
+    except Exception:
+        return None
+
+    # ChatOpenAI is a pydantic model whose __init__ only takes **data, so the
+    # accepted names are its fields and their aliases, not the signature.
+    init_params = set(inspect.signature(ChatOpenAI.__init__).parameters)
+    fields = getattr(ChatOpenAI, "model_fields", None) or getattr(ChatOpenAI, "__fields__", {})
+    for name, model_field in fields.items():
+        init_params.add(name)
+        alias = getattr(model_field, "alias", None)
+        if alias:
+            init_params.add(alias)
+
+    if "base_url" in init_params:
+        base_url_kw: Optional[str] = "base_url"
+    elif "openai_api_base" in init_params:
+        base_url_kw = "openai_api_base"
+    else:
+        base_url_kw = None
+    return ChatOpenAI, base_url_kw
+
+
+@lru_cache(maxsize=4)
+def _build_llm_chain(llm_cfg: LLMConfig) -> Any:
+    """
+    Build the prompt | model | parser chain for an LLM config.
+
+    LLMConfig is frozen and hashable, so composers created with the same
+    settings share one chain (and its HTTP client).
+    """
+    prompt_cls, output_parser_cls = _langchain_prompt_types()
+    chat_openai_cls, base_url_kw = _chat_openai_cls()
+
+    model_kwargs: Dict[str, Any] = {}
+    if llm_cfg.openai.base_url and base_url_kw:
+        model_kwargs[base_url_kw] = llm_cfg.openai.base_url
+
+    model = chat_openai_cls(
+        api_key=llm_cfg.openai.api_key.get_secret_value(),
+        model=llm_cfg.openai.model,
+        temperature=llm_cfg.openai.temperature,
+        max_tokens=llm_cfg.openai.max_tokens,
+        **model_kwargs,
+    )
+
+    prompt = prompt_cls.from_messages(
+        [
+            ("system", _SYSTEM_PROMPT),
+            ("human", _HUMAN_PROMPT),
+        ]
+    )
+    return prompt | model | output_parser_cls()
+
+
+_QUESTION_TOKEN_RE = re.compile(r"[A-Za-z]{4,}")
+_SPECULATIVE_MARKERS = (
+    "maybe",
+    "probably",
+    "might",
+    "i guess",
+    "i think",
+    "likely",
+)
+
 
 class NarrativeComposer:
     """
@@ -24,18 +170,14 @@ class NarrativeComposer:
 
     def __init__(self) -> None:
         self._config = load_config()
-        self._prompt_cls = None
-        self._output_parser = None
         self._llm_chain = None
         self._llm_enabled = False
+        # LLM replies keyed by prompt inputs. Dashboards re-poll the same VIN
+        # or cohort with unchanged evidence, which renders identical prompts.
+        self._response_cache: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
 
-        try:
-            from langchain.prompts import ChatPromptTemplate
-            from langchain_core.output_parsers import StrOutputParser
-
-            self._prompt_cls = ChatPromptTemplate
-            self._output_parser = StrOutputParser()
-        except Exception:
+        if _langchain_prompt_types() is None:
             log_event(
                 logger,
                 "LangChain prompt runtime unavailable, using deterministic templates",
@@ -53,48 +195,14 @@ class NarrativeComposer:
             )
             return
 
-        try:
-            from langchain_openai import ChatOpenAI
-        except Exception:
+        if _chat_openai_cls() is None:
             log_event(
                 logger,
                 "langchain-openai unavailable, using deterministic templates",
             )
             return
 
-        model_kwargs: Dict[str, Any] = {}
-        if llm_cfg.openai.base_url:
-            init_params = inspect.signature(ChatOpenAI.__init__).parameters
-            if "base_url" in init_params:
-                model_kwargs["base_url"] = llm_cfg.openai.base_url
-            elif "openai_api_base" in init_params:
-                model_kwargs["openai_api_base"] = llm_cfg.openai.base_url
-
-        model = ChatOpenAI(
-            api_key=llm_cfg.openai.api_key.get_secret_value(),
-            model=llm_cfg.openai.model,
-            temperature=llm_cfg.openai.temperature,
-            max_tokens=llm_cfg.openai.max_tokens,
-            **model_kwargs,
-        )
-
-        prompt = self._prompt_cls.from_messages(
-            [
-                (
-                    "system",
-                    "You are a predictive-maintenance explainer. "
-                    "Use only provided evidence. Do not invent diagnostics.",
-                ),
-                (
-                    "human",
-                    "Entity: {entity}\n"
-                    "Risk: {risk}\n"
-                    "Top signals:\n{signals}\n"
-                    "Write 2 concise sentences for control-room operators.",
-                ),
-            ]
-        )
-        self._llm_chain = prompt | model | self._output_parser
+        self._llm_chain = _build_llm_chain(llm_cfg)
         self._llm_enabled = True
 
     def compose_vin_summary(
@@ -108,12 +216,13 @@ class NarrativeComposer:
 
         if self._llm_enabled and self._llm_chain is not None:
             try:
-                return self._llm_chain.invoke(
+                return self._invoke_cached(
                     {
                         "entity": f"VIN {vin}",
                         "risk": risk_level,
                         "signals": top,
-                    }
+                    },
+                    vin=vin,
                 )
             except Exception:
                 log_event(
@@ -121,20 +230,8 @@ class NarrativeComposer:
                     "LLM summary generation failed, falling back to deterministic mode",
                 )
 
-        if risk_level == "HIGH":
-            return (
-                f"VIN {vin} shows multiple high-confidence predictive anomalies. "
-                f"Dominant signals: {top}."
-            )
-        if risk_level == "ELEVATED":
-            return (
-                f"VIN {vin} shows elevated predictive risk with active anomaly signals. "
-                f"Dominant signals: {top}."
-            )
-        return (
-            f"VIN {vin} currently has no high-confidence anomaly cluster. "
-            f"Observed signals: {top}."
-        )
+        template = _VIN_SUMMARY_TEMPLATES.get(risk_level, _VIN_SUMMARY_DEFAULT)
+        return template.format(vin=vin, top=top)
 
     def compose_cohort_summary(
         self,
@@ -152,7 +249,7 @@ class NarrativeComposer:
 
         if self._llm_enabled and self._llm_chain is not None:
             try:
-                return self._llm_chain.invoke(
+                return self._invoke_cached(
                     {
                         "entity": f"Cohort {cohort_id}",
                         "risk": risk,
@@ -165,19 +262,9 @@ class NarrativeComposer:
                     "LLM cohort summary generation failed, using fallback text",
                 )
 
-        if high_anomaly_count > 0:
-            return (
-                f"Cohort {cohort_id} has high-severity anomaly concentration requiring immediate triage. "
-                f"Key metrics: {metrics_text}."
-            )
-        if total_anomaly_count > 0:
-            return (
-                f"Cohort {cohort_id} has emerging anomaly patterns that should be monitored. "
-                f"Key metrics: {metrics_text}."
-            )
-        return (
-            f"Cohort {cohort_id} remains stable with no significant anomaly concentration. "
-            f"Key metrics: {metrics_text}."
+        return _COHORT_SUMMARY_TEMPLATES[risk].format(
+            cohort_id=cohort_id,
+            metrics=metrics_text,
         )
 
     def compose_chat_reply(
@@ -195,7 +282,7 @@ class NarrativeComposer:
 
         if self._llm_enabled and self._llm_chain is not None:
             try:
-                return self._llm_chain.invoke(
+                return self._invoke_cached(
                     {
                         "entity": str(entity),
                         "risk": str(risk),
@@ -208,11 +295,61 @@ class NarrativeComposer:
                     "LLM chat composition failed, using bounded fallback",
                 )
 
-        return (
-            f"For {entity}, current risk context is {risk}. "
-            f"Available evidence sources: {evidence_keys}. "
-            "Ask about a specific signal or recommendation for more detail."
-        )
+        return self._fallback_chat_reply(context)
+
+    def stream_chat_reply(
+        self,
+        *,
+        user_message: str,
+        context: Optional[Dict[str, Any]],
+        deterministic_reply: str,
+    ) -> Iterator[str]:
+        """
+        Yield a chat reply incrementally.
+
+        LLM chunks are forwarded as they arrive, so the hybrid scoring used by
+        compose_hybrid_chat_reply is skipped: the reply is committed before it
+        is complete. Without an LLM, or if the stream fails before its first
+        chunk, the deterministic reply is yielded whole. A failure after the
+        first chunk is re-raised, since the partial reply cannot be replaced.
+        """
+        context = context or {}
+        deterministic = (deterministic_reply or "").strip()
+        if not deterministic:
+            deterministic = self._fallback_chat_reply(context)
+
+        if self._llm_enabled and self._llm_chain is not None:
+            inputs = self._chat_candidate_inputs(
+                user_message=user_message,
+                context=context,
+                deterministic_seed=deterministic,
+            )
+            key = self._cache_key(inputs)
+            cached = self._cached_reply(key)
+            if cached is not None:
+                yield cached
+                return
+
+            chunks: List[str] = []
+            try:
+                for chunk in self._llm_chain.stream(inputs):
+                    if chunk:
+                        chunks.append(chunk)
+                        yield chunk
+            except Exception:
+                log_event(
+                    logger,
+                    "LLM chat stream failed",
+                    extra={"partial": bool(chunks)},
+                )
+                if chunks:
+                    raise
+            else:
+                if chunks:
+                    self._store_reply(key, "".join(chunks))
+                    return
+
+        yield deterministic
 
     def compose_hybrid_chat_reply(
         self,
@@ -282,27 +419,96 @@ class NarrativeComposer:
         if not evidence:
             return "none"
 
-        ranked = sorted(
+        # Partial selection; ties keep input order, matching a stable
+        # descending sort truncated to three.
+        top = heapq.nlargest(
+            3,
             evidence,
             key=lambda ev: float(ev.get("confidence", 0.0)),
-            reverse=True,
         )
-        top = ranked[:3]
         return ", ".join(
             f"{ev.get('signal_code')} ({int(float(ev.get('confidence', 0.0)) * 100)}%)"
             for ev in top
         )
 
-    def _compose_llm_chat_candidate(
-        self,
+    @staticmethod
+    def _cache_key(inputs: Dict[str, str], vin: Optional[str] = None) -> Tuple[str, ...]:
+        key = (inputs["entity"], inputs["risk"], inputs["signals"])
+        if vin:
+            key = tuple(part.replace(vin, _VIN_SLOT) for part in key)
+        return key
+
+    def _cached_reply(self, key: Tuple[str, ...]) -> Optional[str]:
+        with self._response_cache_lock:
+            reply = self._response_cache.get(key)
+            if reply is not None:
+                self._response_cache.move_to_end(key)
+            return reply
+
+    def _store_reply(self, key: Tuple[str, ...], reply: str) -> None:
+        with self._response_cache_lock:
+            self._response_cache[key] = reply
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _invoke_cached(self, inputs: Dict[str, str], *, vin: Optional[str] = None) -> str:
+        """
+        Single call site for chain.invoke; identical inputs are answered from
+        the response cache. Failures propagate and are never cached.
+
+        With ``vin``, the VIN is templated out of the key and the stored reply,
+        so vehicles with the same risk and signals share one entry. Only the
+        VIN is slotted: a 17-character VIN is substituted reliably, whereas
+        rewriting confidences or signal codes inside prose would risk a wrong
+        narrative. A reply is only templated when it contains the exact VIN
+        and nothing VIN-like remains afterwards; otherwise it is cached under
+        the exact-match key for this vehicle alone.
+        """
+        exact_key = self._cache_key(inputs)
+        if not vin:
+            reply = self._cached_reply(exact_key)
+            if reply is None:
+                reply = self._llm_chain.invoke(inputs)
+                self._store_reply(exact_key, reply)
+            return reply
+
+        shared_key = self._cache_key(inputs, vin)
+        template = self._cached_reply(shared_key)
+        if template is not None:
+            return template.replace(_VIN_SLOT, vin)
+        reply = self._cached_reply(exact_key)
+        if reply is not None:
+            return reply
+
+        reply = self._llm_chain.invoke(inputs)
+        template = reply.replace(vin, _VIN_SLOT)
+        if template != reply and not _VIN_LIKE_RE.search(template):
+            self._store_reply(shared_key, template)
+        else:
+            self._store_reply(exact_key, reply)
+        return reply
+
+    @staticmethod
+    def _fallback_chat_reply(context: Dict[str, Any]) -> str:
+        entity = context.get("vin") or context.get("cohort_id") or "fleet"
+        risk = context.get("risk_level") or "UNKNOWN"
+        evidence = context.get("evidence_summary") or {}
+        evidence_keys = ", ".join(sorted(evidence.keys())) if isinstance(evidence, dict) else "none"
+
+        return (
+            f"For {entity}, current risk context is {risk}. "
+            f"Available evidence sources: {evidence_keys}. "
+            "Ask about a specific signal or recommendation for more detail."
+        )
+
+    @staticmethod
+    def _chat_candidate_inputs(
         *,
         user_message: str,
         context: Dict[str, Any],
         deterministic_seed: str,
-    ) -> Optional[str]:
-        if not self._llm_enabled or self._llm_chain is None:
-            return None
-
+    ) -> Dict[str, str]:
         entity = context.get("vin") or context.get("cohort_id") or "fleet"
         risk = context.get("risk_level") or "UNKNOWN"
         evidence = context.get("evidence_summary") or {}
@@ -312,18 +518,33 @@ class NarrativeComposer:
             else "none"
         )
 
-        signals = (
-            f"user_question={user_message}; "
-            f"evidence_sources={evidence_keys}; "
-            f"deterministic_baseline={deterministic_seed}"
-        )
+        return {
+            "entity": str(entity),
+            "risk": str(risk),
+            "signals": (
+                f"user_question={user_message}; "
+                f"evidence_sources={evidence_keys}; "
+                f"deterministic_baseline={deterministic_seed}"
+            ),
+        }
+
+    def _compose_llm_chat_candidate(
+        self,
+        *,
+        user_message: str,
+        context: Dict[str, Any],
+        deterministic_seed: str,
+    ) -> Optional[str]:
+        if not self._llm_enabled or self._llm_chain is None:
+            return None
+
         try:
-            return self._llm_chain.invoke(
-                {
-                    "entity": str(entity),
-                    "risk": str(risk),
-                    "signals": signals,
-                }
+            return self._invoke_cached(
+                self._chat_candidate_inputs(
+                    user_message=user_message,
+                    context=context,
+                    deterministic_seed=deterministic_seed,
+                )
             )
         except Exception:
             log_event(
@@ -350,24 +571,22 @@ class NarrativeComposer:
         elif length > 700:
             score -= 2
 
+        text_lc = text.lower()
+
         entity = str(context.get("vin") or context.get("cohort_id") or "").strip()
-        if entity and entity.lower() in text.lower():
+        if entity and entity.lower() in text_lc:
             score += 1
 
         risk_level = context.get("risk_level")
         if isinstance(risk_level, str) and risk_level.strip():
-            if risk_level.lower() in text.lower():
+            if risk_level.lower() in text_lc:
                 score += 2
             else:
                 score -= 2
 
         evidence = context.get("evidence_summary")
         if isinstance(evidence, dict) and evidence:
-            mentioned = 0
-            for key in evidence.keys():
-                if str(key).lower() in text.lower():
-                    mentioned += 1
-            if mentioned > 0:
+            if any(str(key).lower() in text_lc for key in evidence):
                 score += 2
             else:
                 score -= 1
@@ -383,28 +602,27 @@ class NarrativeComposer:
             if str(rec_count) in text:
                 score += 1
 
-        question_tokens = [
-            token.lower()
-            for token in re.findall(r"[A-Za-z]{4,}", user_message)
-        ]
-        if question_tokens:
-            overlap = [
-                tok for tok in question_tokens
-                if tok in text.lower()
-            ]
-            if overlap:
-                score += 1
+        question_tokens = {
+            token.lower() for token in _QUESTION_TOKEN_RE.findall(user_message)
+        }
+        # Substring match is the scoring rule ("risk" also matches "risky"),
+        # so the reply is not tokenized; the set keeps the scan to distinct
+        # question words and any() stops at the first hit.
+        if any(token in text_lc for token in question_tokens):
+            score += 1
 
-        speculative_markers = [
-            "maybe",
-            "probably",
-            "might",
-            "i guess",
-            "i think",
-            "likely",
-        ]
-        for marker in speculative_markers:
-            if marker in text.lower():
-                score -= 2
+        # Each marker present costs 2, so this stays a count rather than any().
+        score -= 2 * sum(1 for marker in _SPECULATIVE_MARKERS if marker in text_lc)
 
         return score
+
+
+@lru_cache(maxsize=1)
+def get_narrative_composer() -> NarrativeComposer:
+    """
+    Return the process-wide composer.
+
+    Sharing it keeps one LLM client (and its HTTP keep-alive pool) and one
+    response cache across every GraphRunner in the process.
+    """
+    return NarrativeComposer()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import List
 
@@ -28,6 +29,29 @@ def _read_requirements(path: Path) -> List[str]:
     return requirements
 
 
+def _ext_modules() -> list:
+    """
+    Optionally compile hot-path backend modules with Cython.
+
+    Enabled with TELEMETRY_CYTHONIZE=1; default installs stay pure Python.
+    """
+    if os.getenv("TELEMETRY_CYTHONIZE", "").strip().lower() not in {"1", "true", "yes", "on"}:
+        return []
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError as exc:
+        raise RuntimeError(
+            "TELEMETRY_CYTHONIZE=1 requires Cython to be installed in the build environment"
+        ) from exc
+
+    return cythonize(
+        ["apps/backend-api/app/services/mart_loader.py"],
+        compiler_directives={"language_level": "3"},
+        quiet=True,
+    )
+
+
 backend_reqs = _read_requirements(ROOT / "apps" / "backend-api" / "requirements.txt")
 runtime_reqs = [req for req in backend_reqs if not req.lower().startswith("pytest")]
 test_reqs = [req for req in backend_reqs if req.lower().startswith("pytest")]
@@ -60,6 +84,7 @@ setup(
             "data/sample/*.json",
         ]
     },
+    ext_modules=_ext_modules(),
     install_requires=runtime_reqs,
     extras_require=extras,
     entry_points={